@@ -12,7 +12,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.utils import generate_sample_sales_data
+from src.utils import generate_sample_sales_data, save_dataset, yield_sample_sales_chunks
 import argparse
 
 
@@ -32,27 +32,63 @@ def main():
     parser.add_argument(
         '--output',
         type=str,
-        default='data/sample_dataset.csv',
-        help='Output file path (default: data/sample_dataset.csv)'
+        default='data/sample_dataset.parquet',
+        help='Output file path; format follows the extension '
+             '(.parquet, .feather or .csv, default: data/sample_dataset.parquet)'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Random seed for reproducible output (default: 42)'
+    )
+    
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=1_000_000,
+        help='Records generated per chunk when streaming Parquet output (default: 1000000)'
     )
     
     args = parser.parse_args()
     
-    print(f"🔄 Generating {args.records:,} sample records...")
+    if args.records < 1:
+        parser.error("--records must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
     
-    # Generate data
-    df = generate_sample_sales_data(args.records)
+    print(f"🔄 Generating {args.records:,} sample records...")
     
-    # Save to file
     output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, index=False)
+    
+    if output_path.suffix.lower() == '.parquet':
+        # Stream Arrow chunks straight to Parquet, bypassing pandas entirely;
+        # peak memory is bounded by --chunk-size
+        import pyarrow.parquet as pq
+        
+        chunks = yield_sample_sales_chunks(args.records, args.chunk_size, args.seed)
+        first_chunk = next(chunks)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        n_rows = first_chunk.num_rows
+        with pq.ParquetWriter(output_path, first_chunk.schema, compression='snappy') as writer:
+            writer.write_table(first_chunk)
+            for chunk in chunks:
+                writer.write_table(chunk)
+                n_rows += chunk.num_rows
+        column_names = first_chunk.schema.names
+    else:
+        # Save to file (format chosen by extension)
+        df = generate_sample_sales_data(args.records, seed=args.seed)
+        output_path = save_dataset(df, output_path)
+        n_rows, column_names = len(df), list(df.columns)
     
     print(f"✓ Sample dataset saved to: {output_path}")
     print(f"\n📊 Dataset Summary:")
-    print(f"  • Records: {len(df):,}")
-    print(f"  • Columns: {len(df.columns)}")
-    print(f"  • Columns: {', '.join(df.columns[:5])}...")
+    print(f"  • Records: {n_rows:,}")
+    print(f"  • Columns: {len(column_names)}")
+    print(f"  • Columns: {', '.join(column_names[:5])}...")
     print(f"  • File Size: {output_path.stat().st_size / 1024:.2f} KB")
     print(f"\n🚀 Ready to analyze:")
     print(f"   python main.py {output_path}")
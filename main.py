@@ -6,17 +6,151 @@ Run automated analysis from the command line.
 """
 
 import argparse
+import itertools
+import os
 import sys
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.utils import load_dataset, create_directory_structure
-from src.eda_engine import perform_eda
-from src.kpi_extractor import extract_kpis
-from src.ai_narrator import generate_narrative
-from src.pdf_generator import generate_pdf_report
+# Pipeline modules (pandas, matplotlib, reportlab, openai) are imported
+# inside the functions that use them so that --help and argument errors
+# return immediately.
+
+
+def _process_one(
+    input_file: str,
+    args: argparse.Namespace,
+    output_dir: Optional[Path] = None
+) -> Tuple[Optional[str], Dict]:
+    """
+    Run the full analysis pipeline for a single dataset
+    
+    Args:
+        input_file: Path to input dataset
+        args: Parsed CLI arguments
+        output_dir: Report directory (defaults to --output); charts go to
+            its assets/ subdirectory. Only batch runs pass one.
+        
+    Returns:
+        Tuple of (PDF path or None if skipped, KPI dictionary)
+    """
+    from src.utils import load_dataset
+    
+    report_dir = output_dir or Path(args.output)
+    
+    # Load dataset
+    if args.verbose:
+        print(f"📁 Loading dataset from: {input_file}")
+    
+    df = load_dataset(input_file, fast_io=args.fast_io)
+    
+    print(f"✓ Dataset loaded: {len(df):,} rows × {len(df.columns)} columns")
+    
+    # Perform EDA
+    if args.verbose:
+        print("🔬 Performing exploratory data analysis...")
+    
+    from src.eda_engine import perform_eda
+    
+    eda_summary = perform_eda(df, output_dir=str(report_dir / "assets"), percentiles=args.percentiles)
+    dataset_type = eda_summary['dataset_info']['dataset_type']
+    
+    print(f"✓ EDA complete. Dataset type: {dataset_type.title()}")
+    
+    # Extract KPIs
+    if args.verbose:
+        print("📊 Extracting key performance indicators...")
+    
+    from src.kpi_extractor import extract_kpis
+    
+    kpis = extract_kpis(df, dataset_type, eda_summary)
+    
+    print(f"✓ Extracted {len(kpis)} KPIs")
+    
+    # Generate narrative
+    if args.verbose:
+        print("🤖 Generating AI narrative...")
+    
+    from src.ai_narrator import AINarrator
+    
+    narrator = AINarrator(args.api_key)
+    
+    # Stream GPT-4 tokens to the terminal, except in batch mode where
+    # several workers would interleave their output
+    stream = output_dir is None and narrator.client is not None
+    if stream:
+        print("\n" + "-"*60)
+        print("🤖 GPT-4 narrative (streaming)")
+        print("-"*60)
+    
+    narrative = narrator.generate_narrative(eda_summary, kpis, stream=stream)
+    
+    if stream:
+        print("-"*60 + "\n")
+    
+    print(f"✓ Narrative generated using: {narrative['method'].upper()}")
+    
+    # Generate PDF
+    pdf_path = None
+    if not args.no_pdf:
+        if args.verbose:
+            print("📄 Creating PDF report...")
+        
+        from src.pdf_generator import generate_pdf_report
+        
+        pdf_path = generate_pdf_report(
+            eda_summary,
+            kpis,
+            narrative,
+            output_dir=str(report_dir),
+            author=args.author
+        )
+        
+        print(f"✓ PDF report saved to: {pdf_path}")
+        print(f"✓ Metadata saved to: {report_dir / 'report_metadata.json'}")
+    
+    return pdf_path, kpis
+
+
+def _process_batch(input_files: list, args: argparse.Namespace) -> bool:
+    """
+    Analyze several datasets in parallel worker processes
+    
+    Each dataset gets its own report directory (<output>/<n>_<file stem>/,
+    n being its position on the command line) so charts, PDFs and metadata
+    from concurrent runs do not collide, even for inputs sharing a stem
+    (a/sales.csv and b/sales.parquet).
+    
+    Args:
+        input_files: Paths to input datasets
+        args: Parsed CLI arguments
+        
+    Returns:
+        True if every dataset was processed successfully
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    max_workers = min(len(input_files), os.cpu_count() or 1)
+    all_ok = True
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_process_one, path, args, Path(args.output) / f"{i}_{Path(path).stem}"): path
+            for i, path in enumerate(input_files, 1)
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                pdf_path, kpis = future.result()
+                print(f"✓ {path}: {len(kpis)} KPIs" + (f" → {pdf_path}" if pdf_path else ""))
+            except Exception as e:
+                all_ok = False
+                print(f"❌ {path}: {e}")
+    
+    return all_ok
 
 
 def main():
@@ -28,7 +162,9 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python main.py data/sample_dataset.csv
+  python main.py data/sample_dataset.parquet
+  python main.py q1.csv q2.csv q3.csv --output batch_reports/
+      (several files run in parallel; reports go to batch_reports/1_q1/, 2_q2/, ...)
   python main.py sales_data.xlsx --author "John Doe"
   python main.py customer_data.csv --api-key sk-xxx --output custom_reports/
 
@@ -37,9 +173,12 @@ Examples:
     )
     
     parser.add_argument(
-        'input_file',
+        'input_files',
+        metavar='input_file',
         type=str,
-        help='Path to input dataset (CSV, Excel, or Parquet)'
+        nargs='+',
+        help='Path to input dataset (CSV, Excel, Parquet, or Feather); '
+             'several files are processed in parallel'
     )
     
     parser.add_argument(
@@ -63,6 +202,20 @@ Examples:
         help='OpenAI API key for GPT-4 narrative generation'
     )
     
+    parser.add_argument(
+        '--fast-io',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Use the PyArrow CSV reader when available (default: enabled)'
+    )
+    
+    parser.add_argument(
+        '--percentiles',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Include 25%%/50%%/75%% quartiles in the numeric statistics (default: enabled)'
+    )
+    
     parser.add_argument(
         '--no-pdf',
         action='store_true',
@@ -78,69 +231,38 @@ Examples:
     args = parser.parse_args()
     
     # Setup
+    from src.utils import create_directory_structure
+    
     create_directory_structure(Path.cwd())
     
     try:
-        # Load dataset
-        if args.verbose:
-            print(f"📁 Loading dataset from: {args.input_file}")
-        
-        df = load_dataset(args.input_file)
-        
-        print(f"✓ Dataset loaded: {len(df):,} rows × {len(df.columns)} columns")
-        
-        # Perform EDA
-        if args.verbose:
-            print("🔬 Performing exploratory data analysis...")
-        
-        eda_summary = perform_eda(df)
-        dataset_type = eda_summary['dataset_info']['dataset_type']
-        
-        print(f"✓ EDA complete. Dataset type: {dataset_type.title()}")
-        
-        # Extract KPIs
-        if args.verbose:
-            print("📊 Extracting key performance indicators...")
-        
-        kpis = extract_kpis(df, dataset_type)
-        
-        print(f"✓ Extracted {len(kpis)} KPIs")
-        
-        # Generate narrative
-        if args.verbose:
-            print("🤖 Generating AI narrative...")
-        
-        narrative = generate_narrative(eda_summary, kpis, args.api_key)
-        
-        print(f"✓ Narrative generated using: {narrative['method'].upper()}")
-        
-        # Generate PDF
-        if not args.no_pdf:
-            if args.verbose:
-                print("📄 Creating PDF report...")
+        if len(args.input_files) > 1:
+            if not _process_batch(args.input_files, args):
+                sys.exit(1)
             
-            pdf_path = generate_pdf_report(
-                eda_summary,
-                kpis,
-                narrative,
-                output_dir=args.output,
-                author=args.author
-            )
-            
-            print(f"✓ PDF report saved to: {pdf_path}")
-            print(f"✓ Metadata saved to: {Path(args.output) / 'report_metadata.json'}")
+            print("\n" + "="*60)
+            print(f"🎉 Batch analysis complete! ({len(args.input_files)} datasets)")
+            print("="*60)
+            return
         
-        print("\n" + "="*60)
-        print("🎉 Analysis complete!")
-        print("="*60)
+        pdf_path, kpis = _process_one(args.input_files[0], args)
         
-        # Print summary KPIs
-        print("\n📊 KEY PERFORMANCE INDICATORS:\n")
-        for key, value in list(kpis.items())[:8]:
-            print(f"  • {key}: {value}")
+        # Print summary KPIs (assembled first, written once)
+        out = [
+            "",
+            "="*60,
+            "🎉 Analysis complete!",
+            "="*60,
+            "",
+            "📊 KEY PERFORMANCE INDICATORS:",
+            ""
+        ]
+        out.extend(f"  • {key}: {value}" for key, value in itertools.islice(kpis.items(), 8))
         
         if len(kpis) > 8:
-            print(f"  ... and {len(kpis) - 8} more KPIs in the PDF report")
+            out.append(f"  ... and {len(kpis) - 8} more KPIs in the PDF report")
+        
+        sys.stdout.write("\n".join(out) + "\n")
         
     except FileNotFoundError as e:
         print(f"❌ Error: {e}")
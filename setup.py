@@ -48,6 +48,10 @@ def create_directories():
         "src"
     ]
     
+    if all(Path(directory).is_dir() for directory in directories):
+        print("✓ Directory structure already exists")
+        return True
+    
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
         print(f"✓ Created: {directory}/")
@@ -79,11 +83,10 @@ def generate_sample_data():
     print_header("📊 Generating Sample Dataset")
     
     try:
-        from src.utils import generate_sample_sales_data
+        from src.utils import generate_sample_sales_data, save_dataset
         
         df = generate_sample_sales_data(1000)
-        output_path = Path("data/sample_dataset.csv")
-        df.to_csv(output_path, index=False)
+        output_path = save_dataset(df, "data/sample_dataset.parquet")
         
         print(f"✓ Sample dataset created: {output_path}")
         print(f"  • Records: {len(df):,}")
@@ -123,7 +126,7 @@ def run_test_analysis():
     try:
         subprocess.check_call([
             sys.executable, "main.py", 
-            "data/sample_dataset.csv",
+            "data/sample_dataset.parquet",
             "--verbose"
         ])
         print("\n✓ Test analysis completed successfully!")
@@ -144,7 +147,7 @@ def show_next_steps():
     print("   streamlit run streamlit_app.py\n")
     
     print("2️⃣  Or use the CLI:")
-    print("   python main.py data/sample_dataset.csv\n")
+    print("   python main.py data/sample_dataset.parquet\n")
     
     print("3️⃣  Analyze your own data:")
     print("   python main.py path/to/your/data.csv --author \"Your Name\"\n")
@@ -6,38 +6,49 @@ Version: 1.0.0
 Author: Rishi Singh
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Rishi Singh"
 __email__ = "rishi@algorzen.com"
 __license__ = "MIT"
 
-from .eda_engine import perform_eda, EDAEngine
-from .kpi_extractor import extract_kpis, KPIExtractor
-from .ai_narrator import generate_narrative, AINarrator
-from .pdf_generator import generate_pdf_report
-from .utils import (
-    load_dataset,
-    save_summary_json,
-    format_number,
-    format_currency,
-    format_percentage,
-    validate_dataframe,
-    generate_sample_sales_data
-)
-
-__all__ = [
-    'perform_eda',
-    'EDAEngine',
-    'extract_kpis',
-    'KPIExtractor',
-    'generate_narrative',
-    'AINarrator',
-    'generate_pdf_report',
-    'load_dataset',
-    'save_summary_json',
-    'format_number',
-    'format_currency',
-    'format_percentage',
-    'validate_dataframe',
-    'generate_sample_sales_data'
-]
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, or a light submodule such as src.utils, does not pull in
+# matplotlib, reportlab and openai.
+_LAZY = {
+    'perform_eda': '.eda_engine',
+    'EDAEngine': '.eda_engine',
+    'extract_kpis': '.kpi_extractor',
+    'KPIExtractor': '.kpi_extractor',
+    'generate_narrative': '.ai_narrator',
+    'generate_many': '.ai_narrator',
+    'AINarrator': '.ai_narrator',
+    'generate_pdf_report': '.pdf_generator',
+    'load_dataset': '.utils',
+    'save_dataset': '.utils',
+    'save_summary_json': '.utils',
+    'format_number': '.utils',
+    'format_currency': '.utils',
+    'format_percentage': '.utils',
+    'validate_dataframe': '.utils',
+    'downcast_dtypes': '.utils',
+    'generate_sample_sales_data': '.utils',
+    'yield_sample_sales_chunks': '.utils'
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
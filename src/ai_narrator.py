@@ -7,79 +7,89 @@ OpenAI's GPT-4 API, with intelligent fallback for offline operation.
 """
 
 import os
-from typing import Dict, Optional
-from dotenv import load_dotenv
+import sys
+import json
+import asyncio
+import hashlib
+import functools
+import itertools
+import threading
+from collections import ChainMap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
-# Try to import OpenAI (optional dependency)
+# python-dotenv is optional
 try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
+    from dotenv import load_dotenv
 except ImportError:
-    OPENAI_AVAILABLE = False
+    def load_dotenv(*args, **kwargs):
+        return False
 
+# OpenAI SDK (optional dependency) is imported on first use, see _get_openai()
+_openai = None
 
-class AINarrator:
+
+@dataclass(frozen=True)
+class Config:
     """
-    AI-powered narrative generation engine
-    
-    Produces executive-level business insights using GPT-4,
-    with fallback to rule-based generation when API unavailable.
+    Environment-derived narrator settings
     """
+    api_key: Optional[str]
+    model: str
+
+
+@functools.cache
+def _load_config() -> Config:
+    """
+    Read .env and environment variables once per process
     
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize AI Narrator
-        
-        Args:
-            api_key: OpenAI API key (optional, will use env var if not provided)
-        """
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        self.model = os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')
-        self.client = None
-        
-        if self.api_key and OPENAI_AVAILABLE:
-            try:
-                self.client = OpenAI(api_key=self.api_key)
-            except Exception as e:
-                print(f"Warning: Could not initialize OpenAI client: {e}")
-                self.client = None
-    
-    def _build_analysis_prompt(self, eda_summary: Dict, kpis: Dict) -> str:
-        """
-        Build comprehensive prompt for GPT-4
-        
-        Args:
-            eda_summary: EDA results dictionary
-            kpis: KPI dictionary
-            
-        Returns:
-            Formatted prompt string
-        """
-        dataset_info = eda_summary.get('dataset_info', {})
-        missing_info = eda_summary.get('missing_values', {})
-        
-        prompt = f"""You are a senior business analyst at Eviden (Created by Algorzen). Analyze the following dataset and provide an executive-level business intelligence report.
+    Returns:
+        Frozen narrator configuration
+    """
+    load_dotenv(override=False)
+    return Config(
+        api_key=os.getenv('OPENAI_API_KEY'),
+        model=os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')
+    )
+
+
+_CONFIG = _load_config()
+
+# Bump whenever the prompt template changes so cached responses are invalidated
+PROMPT_VERSION = 2
+
+# GPT-4 prompt header, filled from dataset_info / missing_values via format_map
+_PROMPT_TMPL = """You are a senior business analyst at Eviden (Created by Algorzen). Analyze the following dataset and provide an executive-level business intelligence report.
 
 DATASET OVERVIEW:
-- Type: {dataset_info.get('dataset_type', 'general').title()}
-- Records: {dataset_info.get('rows', 0):,}
-- Columns: {dataset_info.get('columns', 0)}
-- Numeric Features: {dataset_info.get('numeric_columns', 0)}
-- Categorical Features: {dataset_info.get('categorical_columns', 0)}
+- Type: {dataset_type}
+- Records: {rows:,}
+- Columns: {columns}
+- Numeric Features: {numeric_columns}
+- Categorical Features: {categorical_columns}
 
 DATA QUALITY:
-- Total Missing Values: {missing_info.get('total_missing', 0)}
-- Columns with Missing Data: {missing_info.get('columns_with_missing', 0)}
+- Total Missing Values: {total_missing}
+- Columns with Missing Data: {columns_with_missing}
 
 KEY PERFORMANCE INDICATORS:
 """
-        for key, value in kpis.items():
-            prompt += f"- {key}: {value}\n"
-        
-        prompt += """
+
+_PROMPT_DEFAULTS = {
+    'dataset_type': 'general',
+    'rows': 0,
+    'columns': 0,
+    'numeric_columns': 0,
+    'categorical_columns': 0,
+    'total_missing': 0,
+    'columns_with_missing': 0
+}
+
+_PROMPT_INSTRUCTIONS = """
 Please provide a comprehensive analysis in the following structure:
 
 1. EXECUTIVE SUMMARY (3-5 sentences)
@@ -106,14 +116,309 @@ Tone: Professional, executive-level (McKinsey style)
 Focus: Business value and strategic insights
 Format: Use clear headings and bullet points
 """
-        return prompt
+
+# Static sections of the rule-based fallback narrative
+_FINDINGS_FOOTER = """
+• Statistical analysis reveals distribution patterns requiring strategic attention
+• Correlation analysis identifies key interdependencies between business metrics
+• Data completeness metrics enable confidence in analytical conclusions
+
+## ACTIONABLE RECOMMENDATIONS
+
+"""
+
+# Recommendation blocks keyed by dataset type
+_RECS: Dict[str, str] = {
+    'sales': """• **Optimize Revenue Streams**: Focus on high-performing products and channels identified in the analysis
+• **Enhance Customer Targeting**: Leverage segmentation insights to improve conversion rates
+• **Inventory Management**: Align stock levels with demand patterns observed in quantity metrics
+• **Pricing Strategy**: Review pricing elasticity based on revenue and margin correlations
+• **Sales Forecasting**: Implement predictive models using historical trend patterns
+• **Performance Monitoring**: Establish dashboards for real-time KPI tracking
+""",
+    'finance': """• **Cash Flow Optimization**: Monitor debit/credit patterns to improve liquidity management
+• **Risk Assessment**: Analyze transaction patterns for anomaly detection and fraud prevention
+• **Account Segmentation**: Develop targeted strategies for high-value account retention
+• **Cost Control**: Identify expense categories with optimization potential
+• **Financial Planning**: Use historical patterns for improved budget forecasting
+• **Compliance Monitoring**: Ensure transaction data quality for regulatory reporting
+""",
+    'customer': """• **Churn Prevention**: Implement retention programs targeting at-risk customer segments
+• **Customer Lifetime Value Optimization**: Focus resources on high-value customer acquisition
+• **Segmentation Strategy**: Develop tailored engagement approaches for each customer tier
+• **Experience Enhancement**: Address pain points identified in customer behavior patterns
+• **Loyalty Programs**: Design initiatives based on observed retention factors
+• **Predictive Analytics**: Build churn prediction models for proactive intervention
+""",
+    'general': """• **Data Quality Improvement**: Address missing values and inconsistencies identified in the analysis
+• **Feature Engineering**: Develop new metrics based on correlation insights
+• **Automated Monitoring**: Implement systematic tracking of key performance indicators
+• **Stakeholder Reporting**: Create executive dashboards for strategic decision support
+• **Predictive Modeling**: Leverage historical patterns for forecasting initiatives
+• **Process Optimization**: Use data insights to streamline operational workflows
+""",
+}
+
+# KPI names containing these are called out as critical metrics
+_IMPORTANT_SUBSTRINGS = ('total', 'average')
+_CRITICAL_SUFFIX = " represents a critical operational metric for performance tracking"
+
+_RISKS_HEADER = """
+## RISKS & LIMITATIONS
+
+"""
+
+_SYSTEM_PROMPT = "You are a senior business analyst at Eviden (Created by Algorzen), specialized in data-driven strategic insights."
+
+
+def _get_openai():
+    """
+    Import the OpenAI SDK on first use
+    
+    Keeps the openai/httpx/pydantic import chain off the fallback path,
+    which never needs it.
+    
+    Returns:
+        The openai module, or None if it is not installed
+    """
+    global _openai
+    if _openai is None:
+        try:
+            import openai
+            _openai = openai
+        except ImportError:
+            _openai = False
+    return _openai or None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "OpenAI":
+    """
+    Get a shared OpenAI client for an API key
+    
+    Reusing one client keeps its HTTP connection pool (and TLS sessions)
+    alive across narrator instances.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Cached OpenAI client
+    """
+    return _get_openai().OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _batch_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the event loop that runs generate_many batches
+    
+    The loop lives on a daemon thread for the rest of the process. An async
+    client's connection pool is bound to the loop it first ran on, so a
+    shared client needs a shared loop (asyncio.run would start a new one
+    per batch).
+    
+    Returns:
+        Running event loop
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name='ai-narrator-batch', daemon=True).start()
+    return loop
+
+
+@functools.lru_cache(maxsize=4)
+def _get_async_client(api_key: str) -> "AsyncOpenAI":
+    """
+    Get a shared AsyncOpenAI client for an API key
+    
+    Async counterpart of _get_client; only used on _batch_loop().
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Cached AsyncOpenAI client
+    """
+    return _get_openai().AsyncOpenAI(api_key=api_key)
+
+
+class AINarrator:
+    """
+    AI-powered narrative generation engine
+    
+    Produces executive-level business insights using GPT-4,
+    with fallback to rule-based generation when API unavailable.
+    """
+    
+    # KPIs beyond this count are summarized rather than sent to GPT-4
+    MAX_KPIS_IN_PROMPT = 20
+    
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Path = Path('.cache/ai_narrator')):
+        """
+        Initialize AI Narrator
+        
+        Args:
+            api_key: OpenAI API key (optional, will use env var if not provided)
+            cache_dir: Directory for cached GPT-4 responses (used when AI_NARRATOR_CACHE=1)
+        """
+        self.api_key = api_key or _CONFIG.api_key
+        self.model = _CONFIG.model
+        self.cache_dir = Path(cache_dir)
+        self.cache_enabled = os.getenv('AI_NARRATOR_CACHE') == '1'
+        self.client = None
+        
+        if self.api_key and _get_openai() is not None:
+            try:
+                self.client = _get_client(self.api_key)
+            except Exception as e:
+                print(f"Warning: Could not initialize OpenAI client: {e}")
+                self.client = None
+    
+    def _build_analysis_prompt(self, eda_summary: Dict, kpis: Dict) -> str:
+        """
+        Build comprehensive prompt for GPT-4
+        
+        Args:
+            eda_summary: EDA results dictionary
+            kpis: KPI dictionary
+            
+        Returns:
+            Formatted prompt string
+        """
+        dataset_info = eda_summary.get('dataset_info', {})
+        missing_info = eda_summary.get('missing_values', {})
+        
+        ctx = ChainMap(
+            {'dataset_type': dataset_info.get('dataset_type', 'general').title()},
+            dataset_info,
+            missing_info,
+            _PROMPT_DEFAULTS
+        )
+        
+        parts = [_PROMPT_TMPL.format_map(ctx)]
+        parts.extend(
+            f"- {key}: {value}\n"
+            for key, value in itertools.islice(kpis.items(), self.MAX_KPIS_IN_PROMPT)
+        )
+        
+        if len(kpis) > self.MAX_KPIS_IN_PROMPT:
+            parts.append(f"- ... and {len(kpis) - self.MAX_KPIS_IN_PROMPT} additional KPIs omitted for brevity\n")
+        
+        parts.append(_PROMPT_INSTRUCTIONS)
+        return "".join(parts)
+    
+    def _cache_key(self, eda_summary: Dict, kpis: Dict) -> str:
+        """
+        Compute content hash identifying a GPT-4 request
+        
+        Args:
+            eda_summary: EDA results dictionary
+            kpis: KPI dictionary
+            
+        Returns:
+            Hex digest of the analysis inputs, model and prompt version
+        """
+        payload = json.dumps(
+            [eda_summary, kpis, self.model, PROMPT_VERSION],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode()).hexdigest()
+    
+    def _read_cache(self, key: str) -> Optional[str]:
+        """
+        Load cached narrative text for a key, if present
+        
+        Args:
+            key: Cache key from _cache_key
+            
+        Returns:
+            Cached narrative text, or None on miss
+        """
+        cache_file = self.cache_dir / f"{key}.json"
+        if not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f).get('narrative')
+        except (OSError, ValueError):
+            return None
     
-    def _generate_with_gpt4(self, prompt: str) -> str:
+    def _write_cache(self, key: str, narrative_text: str):
+        """
+        Atomically store narrative text under a key
+        
+        Args:
+            key: Cache key from _cache_key
+            narrative_text: GPT-4 generated narrative
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_dir / f"{key}.{os.getpid()}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({'narrative': narrative_text, 'model': self.model}, f)
+            tmp_file.replace(self.cache_dir / f"{key}.json")
+        except OSError as e:
+            print(f"Warning: Could not write narrative cache: {e}")
+    
+    def _completion_params(self, prompt: str) -> Dict:
+        """
+        Build chat completion request parameters
+        
+        Args:
+            prompt: Analysis prompt
+            
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return {
+            'model': self.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": _SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            'temperature': 0.7,
+            'max_tokens': 1500
+        }
+    
+    def _stream_with_gpt4(self, prompt: str) -> Iterator[str]:
+        """
+        Stream narrative text deltas from GPT-4 as they are generated
+        
+        Args:
+            prompt: Analysis prompt
+            
+        Yields:
+            Text chunks in generation order
+        """
+        response = self.client.chat.completions.create(**self._completion_params(prompt), stream=True)
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
+    def _generate_with_gpt4(
+        self,
+        prompt: str,
+        stream: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Generate narrative using GPT-4
         
         Args:
             prompt: Analysis prompt
+            stream: Echo tokens to stdout as they arrive
+            on_delta: Called with each text chunk as it arrives
             
         Returns:
             Generated narrative text
@@ -122,21 +427,40 @@ Format: Use clear headings and bullet points
             return None
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a senior business analyst at Eviden (Created by Algorzen), specialized in data-driven strategic insights."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
+            if stream or on_delta:
+                buf = []
+                for delta in self._stream_with_gpt4(prompt):
+                    buf.append(delta)
+                    if on_delta:
+                        on_delta(delta)
+                    if stream:
+                        sys.stdout.write(delta)
+                        sys.stdout.flush()
+                if stream:
+                    sys.stdout.write("\n")
+                return "".join(buf)
+            
+            response = self.client.chat.completions.create(**self._completion_params(prompt))
+            
+            return response.choices[0].message.content
+            
+        except Exception as e:
+            print(f"Error calling OpenAI API: {e}")
+            return None
+    
+    async def _agenerate_with_gpt4(self, prompt: str, async_client: "AsyncOpenAI") -> Optional[str]:
+        """
+        Generate narrative using GPT-4 without blocking the event loop
+        
+        Args:
+            prompt: Analysis prompt
+            async_client: AsyncOpenAI client to issue the request with
+            
+        Returns:
+            Generated narrative text
+        """
+        try:
+            response = await async_client.chat.completions.create(**self._completion_params(prompt))
             
             return response.choices[0].message.content
             
@@ -160,7 +484,10 @@ Format: Use clear headings and bullet points
         rows = dataset_info.get('rows', 0)
         missing_info = eda_summary.get('missing_values', {})
         
-        narrative = f"""## EXECUTIVE SUMMARY
+        # Dynamic risk assessment
+        data_completeness = 100 - (missing_info.get('total_missing', 0) / (rows * dataset_info.get('columns', 1)) * 100)
+        
+        parts = [f"""## EXECUTIVE SUMMARY
 
 This {dataset_type} dataset comprises {rows:,} records across {dataset_info.get('columns', 0)} features, providing a comprehensive view of operational metrics. The analysis reveals key performance indicators with strategic implications for business optimization. Data quality assessment indicates {missing_info.get('total_missing', 0)} missing values across {missing_info.get('columns_with_missing', 0)} columns, requiring attention in downstream analytics.
 
@@ -168,78 +495,38 @@ Our automated analysis identifies critical patterns in {dataset_info.get('numeri
 
 ## KEY FINDINGS
 
-"""
+"""]
         
         # Add KPI-based findings
-        kpi_list = list(kpis.items())
-        for i, (key, value) in enumerate(kpi_list[:6]):
-            if 'total' in key.lower() or 'average' in key.lower():
-                narrative += f"• **{key}**: {value} represents a critical operational metric for performance tracking\n"
-            else:
-                narrative += f"• **{key}**: {value}\n"
-        
-        narrative += """
-• Statistical analysis reveals distribution patterns requiring strategic attention
-• Correlation analysis identifies key interdependencies between business metrics
-• Data completeness metrics enable confidence in analytical conclusions
-
-## ACTIONABLE RECOMMENDATIONS
-
-"""
+        items = list(itertools.islice(kpis.items(), 6))
+        lower_keys = [key.lower() for key, _ in items]
+        for (key, value), lk in zip(items, lower_keys):
+            suffix = _CRITICAL_SUFFIX if any(sub in lk for sub in _IMPORTANT_SUBSTRINGS) else ""
+            parts.append(f"• **{key}**: {value}{suffix}\n")
         
-        if dataset_type == 'sales':
-            narrative += """• **Optimize Revenue Streams**: Focus on high-performing products and channels identified in the analysis
-• **Enhance Customer Targeting**: Leverage segmentation insights to improve conversion rates
-• **Inventory Management**: Align stock levels with demand patterns observed in quantity metrics
-• **Pricing Strategy**: Review pricing elasticity based on revenue and margin correlations
-• **Sales Forecasting**: Implement predictive models using historical trend patterns
-• **Performance Monitoring**: Establish dashboards for real-time KPI tracking
-"""
-        elif dataset_type == 'finance':
-            narrative += """• **Cash Flow Optimization**: Monitor debit/credit patterns to improve liquidity management
-• **Risk Assessment**: Analyze transaction patterns for anomaly detection and fraud prevention
-• **Account Segmentation**: Develop targeted strategies for high-value account retention
-• **Cost Control**: Identify expense categories with optimization potential
-• **Financial Planning**: Use historical patterns for improved budget forecasting
-• **Compliance Monitoring**: Ensure transaction data quality for regulatory reporting
-"""
-        elif dataset_type == 'customer':
-            narrative += """• **Churn Prevention**: Implement retention programs targeting at-risk customer segments
-• **Customer Lifetime Value Optimization**: Focus resources on high-value customer acquisition
-• **Segmentation Strategy**: Develop tailored engagement approaches for each customer tier
-• **Experience Enhancement**: Address pain points identified in customer behavior patterns
-• **Loyalty Programs**: Design initiatives based on observed retention factors
-• **Predictive Analytics**: Build churn prediction models for proactive intervention
-"""
-        else:
-            narrative += """• **Data Quality Improvement**: Address missing values and inconsistencies identified in the analysis
-• **Feature Engineering**: Develop new metrics based on correlation insights
-• **Automated Monitoring**: Implement systematic tracking of key performance indicators
-• **Stakeholder Reporting**: Create executive dashboards for strategic decision support
-• **Predictive Modeling**: Leverage historical patterns for forecasting initiatives
-• **Process Optimization**: Use data insights to streamline operational workflows
-"""
-        
-        narrative += """
-## RISKS & LIMITATIONS
-
-"""
-        
-        # Dynamic risk assessment
-        data_completeness = 100 - (missing_info.get('total_missing', 0) / (rows * dataset_info.get('columns', 1)) * 100)
+        parts.append(_FINDINGS_FOOTER)
+        parts.append(_RECS.get(dataset_type, _RECS['general']))
+        parts.append(_RISKS_HEADER)
         
         if data_completeness < 95:
-            narrative += f"• **Data Quality**: {missing_info.get('total_missing', 0)} missing values may impact analytical reliability\n"
+            parts.append(f"• **Data Quality**: {missing_info.get('total_missing', 0)} missing values may impact analytical reliability\n")
         
-        narrative += f"""• **Sample Size Considerations**: Analysis based on {rows:,} records; trends may vary with additional data
+        parts.append(f"""• **Sample Size Considerations**: Analysis based on {rows:,} records; trends may vary with additional data
 • **Temporal Limitations**: Results reflect current dataset timeframe; market conditions may evolve
 • **Correlation vs Causation**: Observed patterns require validation before implementing strategic changes
 • **External Factors**: Analysis does not account for exogenous variables affecting business performance
-"""
+""")
         
-        return narrative
+        return "".join(parts)
     
-    def generate_narrative(self, eda_summary: Dict, kpis: Dict, force_fallback: bool = False) -> Dict[str, str]:
+    def generate_narrative(
+        self,
+        eda_summary: Dict,
+        kpis: Dict,
+        force_fallback: bool = False,
+        stream: bool = False,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, str]:
         """
         Generate comprehensive business narrative
         
@@ -247,20 +534,90 @@ Our automated analysis identifies critical patterns in {dataset_info.get('numeri
             eda_summary: EDA results dictionary
             kpis: KPI dictionary
             force_fallback: Force use of fallback generator (for testing)
+            stream: Echo GPT-4 tokens to stdout as they arrive
+            on_delta: Called with each GPT-4 text chunk as it arrives
             
         Returns:
             Dictionary with narrative sections and metadata
         """
         narrative_text = None
         method_used = "fallback"
+        cache_key = None
+        
+        # Reuse a previous GPT-4 response for identical inputs
+        if not force_fallback and self.cache_enabled:
+            cache_key = self._cache_key(eda_summary, kpis)
+            narrative_text = self._read_cache(cache_key)
+            if narrative_text:
+                method_used = "cache"
         
         # Try GPT-4 first if available
-        if not force_fallback and self.client:
+        if not narrative_text and not force_fallback and self.client:
             prompt = self._build_analysis_prompt(eda_summary, kpis)
-            narrative_text = self._generate_with_gpt4(prompt)
+            narrative_text = self._generate_with_gpt4(prompt, stream=stream, on_delta=on_delta)
             if narrative_text:
                 method_used = "gpt-4"
+                if cache_key:
+                    self._write_cache(cache_key, narrative_text)
         
+        return self._finalize_narrative(eda_summary, kpis, narrative_text, method_used)
+    
+    async def agenerate_narrative(
+        self,
+        eda_summary: Dict,
+        kpis: Dict,
+        async_client: Optional["AsyncOpenAI"] = None
+    ) -> Dict[str, str]:
+        """
+        Async variant of generate_narrative for concurrent batch runs
+        
+        Args:
+            eda_summary: EDA results dictionary
+            kpis: KPI dictionary
+            async_client: AsyncOpenAI client (fallback narrative if None)
+            
+        Returns:
+            Dictionary with narrative sections and metadata
+        """
+        narrative_text = None
+        method_used = "fallback"
+        cache_key = None
+        
+        if self.cache_enabled:
+            cache_key = self._cache_key(eda_summary, kpis)
+            narrative_text = self._read_cache(cache_key)
+            if narrative_text:
+                method_used = "cache"
+        
+        if not narrative_text and async_client is not None:
+            prompt = self._build_analysis_prompt(eda_summary, kpis)
+            narrative_text = await self._agenerate_with_gpt4(prompt, async_client)
+            if narrative_text:
+                method_used = "gpt-4"
+                if cache_key:
+                    self._write_cache(cache_key, narrative_text)
+        
+        return self._finalize_narrative(eda_summary, kpis, narrative_text, method_used)
+    
+    def _finalize_narrative(
+        self,
+        eda_summary: Dict,
+        kpis: Dict,
+        narrative_text: Optional[str],
+        method_used: str
+    ) -> Dict[str, str]:
+        """
+        Apply the rule-based fallback if needed and attach metadata
+        
+        Args:
+            eda_summary: EDA results dictionary
+            kpis: KPI dictionary
+            narrative_text: Generated text, or None if GPT-4 failed/unavailable
+            method_used: Generation method label
+            
+        Returns:
+            Dictionary with narrative sections and metadata
+        """
         # Use fallback if GPT-4 failed or unavailable
         if not narrative_text:
             narrative_text = self._generate_fallback_narrative(eda_summary, kpis)
@@ -268,12 +625,18 @@ Our automated analysis identifies critical patterns in {dataset_info.get('numeri
         return {
             'narrative': narrative_text,
             'method': method_used,
-            'model': self.model if method_used == "gpt-4" else "rule-based",
+            'model': self.model if method_used in ("gpt-4", "cache") else "rule-based",
             'api_available': self.client is not None
         }
 
 
-def generate_narrative(eda_summary: Dict, kpis: Dict, api_key: Optional[str] = None) -> Dict[str, str]:
+def generate_narrative(
+    eda_summary: Dict,
+    kpis: Dict,
+    api_key: Optional[str] = None,
+    stream: bool = False,
+    on_delta: Optional[Callable[[str], None]] = None
+) -> Dict[str, str]:
     """
     Convenience function to generate AI narrative
     
@@ -281,9 +644,34 @@ def generate_narrative(eda_summary: Dict, kpis: Dict, api_key: Optional[str] = N
         eda_summary: EDA results dictionary
         kpis: KPI dictionary
         api_key: Optional OpenAI API key
+        stream: Echo GPT-4 tokens to stdout as they arrive
+        on_delta: Called with each GPT-4 text chunk as it arrives
         
     Returns:
         Narrative dictionary
     """
     narrator = AINarrator(api_key)
-    return narrator.generate_narrative(eda_summary, kpis)
+    return narrator.generate_narrative(eda_summary, kpis, stream=stream, on_delta=on_delta)
+
+
+def generate_many(inputs: List[Tuple[Dict, Dict]], api_key: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Generate narratives for several datasets concurrently
+    
+    Args:
+        inputs: List of (eda_summary, kpis) pairs
+        api_key: Optional OpenAI API key
+        
+    Returns:
+        Narrative dictionaries in the same order as inputs
+    """
+    narrator = AINarrator(api_key)
+    async_client = _get_async_client(narrator.api_key) if narrator.client else None
+    
+    async def _run():
+        return await asyncio.gather(*[
+            narrator.agenerate_narrative(eda_summary, kpis, async_client)
+            for eda_summary, kpis in inputs
+        ])
+    
+    return list(asyncio.run_coroutine_threadsafe(_run(), _batch_loop()).result())
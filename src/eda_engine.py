@@ -10,16 +10,160 @@ This module performs comprehensive automated EDA including:
 - Distribution visualizations
 """
 
+import re
+import threading
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless raster backend; charts are only saved to disk
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
 import seaborn as sns
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import warnings
 
+from ._numba_kernels import NUMBA_AVAILABLE, count_nans, parallel_threads
+from .utils import NUMBA_MIN_ROWS, SAMPLE_THRESH, classify_columns, count_missing, ensure_categorical
+
 warnings.filterwarnings('ignore')
 
+# Try to import numbagg (optional JIT-compiled NaN-aware reductions)
+try:
+    import numbagg
+    NUMBAGG_AVAILABLE = True
+except ImportError:
+    NUMBAGG_AVAILABLE = False
+
+# Column-name keywords indicating each dataset type
+_TYPE_KEYWORDS = {
+    'sales': ['sales', 'revenue', 'price', 'quantity', 'product', 'order'],
+    'finance': ['balance', 'debit', 'credit', 'transaction', 'account', 'profit', 'margin'],
+    'customer': ['customer', 'churn', 'retention', 'lifetime', 'segment', 'age']
+}
+
+# One compiled alternation per dataset type
+_TYPE_PATTERNS = {
+    dataset_type: re.compile('|'.join(map(re.escape, keywords)))
+    for dataset_type, keywords in _TYPE_KEYWORDS.items()
+}
+
+# Heatmaps wider than this are unreadable; keep the highest-variance columns
+MAX_HEATMAP_COLS = 30
+
+
+def _corr_matrix(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """
+    Pairwise-complete Pearson correlation from a float32 block
+    
+    Equivalent to df[cols].corr(), but computed with a handful of matrix
+    products instead of a loop over column pairs. Columns are centred
+    first so the float32 sums do not lose precision.
+    
+    Args:
+        df: Input DataFrame
+        cols: Numeric columns to correlate
+        
+    Returns:
+        Correlation matrix as a DataFrame indexed by cols
+    """
+    X = df[cols].to_numpy(dtype=np.float32, na_value=np.nan)
+    present = ~np.isnan(X)
+    X = np.where(present, X - np.nanmean(X, axis=0), np.float32(0))
+    M = present.astype(np.float32)
+    
+    n = (M.T @ M).astype(np.float64)
+    sx = (X.T @ M).astype(np.float64)           # sum of x_i where x_j present
+    sxx = ((X * X).T @ M).astype(np.float64)
+    sxy = (X.T @ X).astype(np.float64)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sx.T / n
+        var_x = sxx - sx * sx / n
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[n < 2] = np.nan
+    np.clip(corr, -1.0, 1.0, out=corr)
+    
+    return pd.DataFrame(corr, index=cols, columns=cols)
+
+
+def _type_decided(scores: Dict[str, int], remaining: int) -> bool:
+    """
+    Whether dataset-type scores are final regardless of the remaining columns
+    
+    Mirrors the decision in EDAEngine._detect_dataset_type: the highest
+    score wins if it is at least 2, ties going to the earlier type.
+    
+    Args:
+        scores: Current score per dataset type, in priority order
+        remaining: Number of columns not yet scored
+        
+    Returns:
+        True if scanning further columns cannot change the outcome
+    """
+    # Nothing can reach the threshold: 'general' is certain
+    if max(scores.values()) + remaining < 2:
+        return True
+    
+    leader = max(scores, key=scores.get)
+    if scores[leader] < 2:
+        return False
+    
+    order = list(scores)
+    for dataset_type, score in scores.items():
+        if dataset_type == leader:
+            continue
+        best_case = score + remaining
+        if best_case > scores[leader]:
+            return False
+        if best_case == scores[leader] and order.index(dataset_type) < order.index(leader):
+            return False
+    return True
+
+
+def _fast_hist(ax, series: pd.Series, bins: int = 30) -> None:
+    """
+    Draw a histogram as a single bar container
+    
+    Bins with np.histogram on the raw array, skipping the per-bin patch
+    bookkeeping and autoscaling of ax.hist.
+    
+    Args:
+        ax: Matplotlib axes to draw on
+        series: Numeric Series; NaNs are ignored
+        bins: Number of bins
+    """
+    arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    arr = arr[~np.isnan(arr)]
+    counts, edges = np.histogram(arr, bins=bins)
+    ax.bar(
+        edges[:-1],
+        counts,
+        width=np.diff(edges),
+        align='edge',
+        color='#2E86AB',
+        alpha=0.7,
+        edgecolor='black'
+    )
+
+
+def _light_ticks(ax, y_locator: bool = True) -> None:
+    """
+    Cap major ticks and disable minor ticks to cut tick rendering work
+    
+    Args:
+        ax: Matplotlib axes
+        y_locator: Also cap the y axis; leave False where y ticks are
+            category labels set explicitly
+    """
+    ax.tick_params(which='minor', bottom=False, left=False)
+    ax.xaxis.set_major_locator(MaxNLocator(4))
+    if y_locator:
+        ax.yaxis.set_major_locator(MaxNLocator(5))
+
+
 # Set professional style
 sns.set_style("whitegrid")
 plt.rcParams['figure.facecolor'] = 'white'
@@ -34,51 +178,113 @@ class EDAEngine:
     statistical analysis and visualizations.
     """
     
-    def __init__(self, df: pd.DataFrame, output_dir: str = "reports/assets"):
+    def __init__(self, df: pd.DataFrame, output_dir: str = "reports/assets", dpi: int = 150):
         """
         Initialize EDA Engine
         
         Args:
             df: Input pandas DataFrame
             output_dir: Directory to save charts and visualizations
+            dpi: Resolution of saved charts
         """
-        self.df = df
+        self.dpi = dpi
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-        self.categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
-        self.datetime_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+        self.columns = classify_columns(df)
+        self.numeric_cols = self.columns.numeric
+        self.categorical_cols = self.columns.categorical
+        self.datetime_cols = self.columns.datetime
+        
+        # Convert low-cardinality string columns once so every later
+        # nunique/value_counts pass counts integer codes; the caller's
+        # frame is left untouched
+        self.df = df.copy(deep=False)
+        for col in self.categorical_cols:
+            self.df[col] = ensure_categorical(df[col])
+        
+        # Cardinality of every categorical column, computed once
+        self._sampled = len(df) > SAMPLE_THRESH
+        cat_frame = self.df[self.categorical_cols]
+        if self._sampled:
+            cat_frame = cat_frame.sample(n=SAMPLE_THRESH, random_state=0)
+        self._card = cat_frame.nunique()
         
         self.dataset_type = self._detect_dataset_type()
         self.eda_summary = {}
         
-    def _detect_dataset_type(self) -> str:
+        # Memoised analysis results, valid while the fingerprint matches
+        self._cache = {}
+        self._cache_fingerprint = None
+        self._plot_lock = threading.Lock()
+    
+    def _fingerprint(self) -> Tuple:
         """
-        Detect dataset type based on column names and structure
+        Cheap identity of the analysed frame (the frame itself is unhashable)
         
         Returns:
-            Dataset type: 'sales', 'finance', 'customer', or 'general'
+            Tuple of frame id, shape and dtype strings
         """
-        cols_lower = [col.lower() for col in self.df.columns]
-        
-        # Sales indicators
-        sales_keywords = ['sales', 'revenue', 'price', 'quantity', 'product', 'order']
-        sales_score = sum(any(kw in col for kw in sales_keywords) for col in cols_lower)
+        return (id(self.df), self.df.shape, tuple(self.df.dtypes.astype(str)))
+    
+    def _cached(self, key: str, compute):
+        """
+        Return a memoised result, recomputing after self.df changes
         
-        # Finance indicators
-        finance_keywords = ['balance', 'debit', 'credit', 'transaction', 'account', 'profit', 'margin']
-        finance_score = sum(any(kw in col for kw in finance_keywords) for col in cols_lower)
+        Args:
+            key: Cache entry name
+            compute: Zero-argument callable producing the result
+            
+        Returns:
+            Cached or freshly computed result
+        """
+        fingerprint = self._fingerprint()
+        if fingerprint != self._cache_fingerprint:
+            self._cache = {}
+            self._cache_fingerprint = fingerprint
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+        
+    def _col_for_stats(self, col: str) -> pd.Series:
+        """
+        Column to hash for value counts, sampled on very large frames
         
-        # Customer indicators
-        customer_keywords = ['customer', 'churn', 'retention', 'lifetime', 'segment', 'age']
-        customer_score = sum(any(kw in col for kw in customer_keywords) for col in cols_lower)
+        Args:
+            col: Column name
+            
+        Returns:
+            The full column, or a SAMPLE_THRESH-row random sample of it;
+            categoricals keep only the categories that occur
+        """
+        series = self.df[col]
+        if self._sampled:
+            series = series.sample(n=SAMPLE_THRESH, random_state=0)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # value_counts lists every category, including ones with no rows
+            series = series.cat.remove_unused_categories()
+        return series
+    
+    def _detect_dataset_type(self) -> str:
+        """
+        Detect dataset type based on column names and structure
         
-        scores = {
-            'sales': sales_score,
-            'finance': finance_score,
-            'customer': customer_score
-        }
+        Returns:
+            Dataset type: 'sales', 'finance', 'customer', or 'general'
+        """
+        cols_lower = [str(col).lower() for col in self.df.columns]
+        scores = dict.fromkeys(_TYPE_PATTERNS, 0)
+        
+        # Count columns matching each type's keywords in a single pass,
+        # stopping once the remaining columns can no longer change the result
+        remaining = len(cols_lower)
+        for col in cols_lower:
+            remaining -= 1
+            for dataset_type, pattern in _TYPE_PATTERNS.items():
+                if pattern.search(col):
+                    scores[dataset_type] += 1
+            if _type_decided(scores, remaining):
+                break
         
         max_score = max(scores.values())
         if max_score >= 2:
@@ -92,7 +298,23 @@ class EDAEngine:
         Returns:
             Dictionary with missing value statistics
         """
-        missing = self.df.isnull().sum()
+        return self._cached('missing_values', self._analyze_missing_values)
+    
+    def _analyze_missing_values(self) -> Dict:
+        """Uncached body of analyze_missing_values"""
+        if NUMBA_AVAILABLE and parallel_threads() > 1 and len(self.df) >= NUMBA_MIN_ROWS:
+            # Plain float columns are scanned in place by the parallel
+            # numba kernel; everything else goes through pandas
+            missing = pd.Series(
+                [count_nans(series.to_numpy())
+                 if isinstance(series.dtype, np.dtype) and series.dtype.kind == 'f'
+                 else series.isna().sum()
+                 for _, series in self.df.items()],
+                index=self.df.columns,
+                dtype='int64'
+            )
+        else:
+            missing = count_missing(self.df)
         missing_pct = (missing / len(self.df)) * 100
         
         missing_df = pd.DataFrame({
@@ -109,13 +331,59 @@ class EDAEngine:
             'missing_details': missing_df.to_dict('index') if len(missing_df) > 0 else {}
         }
     
-    def get_column_statistics(self) -> Dict:
+    def _numeric_statistics(self, percentiles: bool = True) -> Dict:
+        """
+        Compute describe()-style statistics for all numeric columns
+        
+        Uses numbagg's parallel reductions over one float64 block when
+        available, otherwise falls back to pandas.
+        
+        Args:
+            percentiles: Also compute the sort-based 25%/50%/75% quartiles
+        
+        Returns:
+            Dictionary mapping column name to its statistics
+        """
+        if not NUMBAGG_AVAILABLE:
+            numeric = self.df[self.numeric_cols]
+            if percentiles:
+                return numeric.describe().T.to_dict('index')
+            return numeric.agg(['count', 'mean', 'std', 'min', 'max']).T.to_dict('index')
+        
+        arr = self.df[self.numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        columns = {
+            'count': numbagg.nancount(arr, axis=0),
+            'mean': numbagg.nanmean(arr, axis=0),
+            'std': numbagg.nanstd(arr, axis=0, ddof=1),
+            'min': numbagg.nanmin(arr, axis=0)
+        }
+        if percentiles:
+            quartiles = numbagg.nanquantile(arr, [0.25, 0.5, 0.75], axis=0)
+            columns.update({'25%': quartiles[0], '50%': quartiles[1], '75%': quartiles[2]})
+        columns['max'] = numbagg.nanmax(arr, axis=0)
+        
+        return {
+            col: {stat: float(values[i]) for stat, values in columns.items()}
+            for i, col in enumerate(self.numeric_cols)
+        }
+    
+    def get_column_statistics(self, percentiles: bool = True) -> Dict:
         """
         Generate comprehensive column statistics
         
+        Args:
+            percentiles: Include 25%/50%/75% quartiles for numeric columns;
+                these need a sort per column, so callers that don't use
+                them can turn them off
+        
         Returns:
             Dictionary with numeric and categorical statistics
         """
+        return self._cached(f'column_statistics:{percentiles}',
+                            lambda: self._get_column_statistics(percentiles))
+    
+    def _get_column_statistics(self, percentiles: bool) -> Dict:
+        """Uncached body of get_column_statistics"""
         stats = {
             'numeric': {},
             'categorical': {},
@@ -124,15 +392,17 @@ class EDAEngine:
         
         # Numeric statistics
         if self.numeric_cols:
-            numeric_stats = self.df[self.numeric_cols].describe().T
-            stats['numeric'] = numeric_stats.to_dict('index')
+            stats['numeric'] = self._numeric_statistics(percentiles)
         
         # Categorical statistics
         for col in self.categorical_cols[:10]:  # Limit to top 10
+            # One counting pass gives cardinality, mode and its frequency
+            vc = self._col_for_stats(col).value_counts()
             stats['categorical'][col] = {
-                'unique_values': int(self.df[col].nunique()),
-                'top_value': str(self.df[col].mode()[0]) if len(self.df[col].mode()) > 0 else 'N/A',
-                'top_frequency': int(self.df[col].value_counts().iloc[0]) if len(self.df[col]) > 0 else 0
+                'unique_values': len(vc),
+                'top_value': str(vc.index[0]) if len(vc) > 0 else 'N/A',
+                'top_frequency': int(vc.iat[0]) if len(vc) > 0 else 0,
+                'sampled': self._sampled
             }
         
         # DateTime statistics
@@ -145,6 +415,25 @@ class EDAEngine:
         
         return stats
     
+    def correlation_matrix(self) -> pd.DataFrame:
+        """
+        Correlation matrix of the numeric columns shown in the heatmap
+        
+        Returns:
+            Correlation DataFrame, limited to the MAX_HEATMAP_COLS
+            highest-variance columns
+        """
+        return self._cached('correlation', self._correlation_matrix)
+    
+    def _correlation_matrix(self) -> pd.DataFrame:
+        """Uncached body of correlation_matrix"""
+        cols = self.numeric_cols
+        if len(cols) > MAX_HEATMAP_COLS:
+            variances = self.df[cols].var()
+            top = set(variances.nlargest(MAX_HEATMAP_COLS).index)
+            cols = [col for col in cols if col in top]
+        return _corr_matrix(self.df, cols)
+    
     def generate_correlation_heatmap(self) -> Optional[str]:
         """
         Generate correlation heatmap for numeric columns
@@ -155,10 +444,16 @@ class EDAEngine:
         if len(self.numeric_cols) < 2:
             return None
         
-        plt.figure(figsize=(12, 10))
+        # constrained_layout solves the layout once at draw time, so no
+        # tight_layout() or tight bbox pass is needed when saving. The
+        # figure is built directly rather than through pyplot, whose
+        # current-figure state is shared by every thread
+        fig = Figure(figsize=(12, 10), constrained_layout=True)
+        FigureCanvasAgg(fig)  # seaborn measures tick labels with the canvas renderer
+        ax = fig.subplots()
         
         # Calculate correlation matrix
-        corr_matrix = self.df[self.numeric_cols].corr()
+        corr_matrix = self.correlation_matrix()
         
         # Create mask for upper triangle
         mask = np.triu(np.ones_like(corr_matrix, dtype=bool))
@@ -173,15 +468,14 @@ class EDAEngine:
             center=0,
             square=True,
             linewidths=1,
-            cbar_kws={"shrink": 0.8}
+            cbar_kws={"shrink": 0.8},
+            ax=ax
         )
         
-        plt.title('Correlation Matrix - Eviden Analysis', fontsize=16, fontweight='bold', pad=20)
-        plt.tight_layout()
+        ax.set_title('Correlation Matrix - Eviden Analysis', fontsize=16, fontweight='bold', pad=20)
         
         output_path = self.output_dir / "correlation_heatmap.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=self.dpi, bbox_inches=None)
         
         return str(output_path)
     
@@ -189,91 +483,111 @@ class EDAEngine:
         """
         Generate distribution plots for top numeric and categorical columns
         
+        Both groups share one figure: numeric histograms on the top row,
+        categorical bar charts on the bottom row.
+        
         Returns:
-            Dictionary mapping plot type to file path
+            Dictionary mapping 'combined' to the saved figure path
+            (empty if there is nothing to plot)
         """
         plots = {}
         
         # Top 4 numeric distributions
-        if self.numeric_cols:
-            top_numeric = self.numeric_cols[:4]
-            fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-            axes = axes.flatten()
-            
-            for idx, col in enumerate(top_numeric):
-                if idx < len(axes):
-                    axes[idx].hist(
-                        self.df[col].dropna(),
-                        bins=30,
-                        color='#2E86AB',
-                        alpha=0.7,
-                        edgecolor='black'
-                    )
-                    axes[idx].set_title(f'{col} Distribution', fontweight='bold')
-                    axes[idx].set_xlabel(col)
-                    axes[idx].set_ylabel('Frequency')
-                    axes[idx].grid(alpha=0.3)
+        top_numeric = self.numeric_cols[:4]
+        
+        # Top 4 categorical distributions with a reasonable number of categories
+        valid_cats = [col for col in self.categorical_cols 
+                     if self._card[col] <= 20][:4]
+        
+        rows = [row for row in (top_numeric, valid_cats) if row]
+        if not rows:
+            return plots
+        
+        fig = Figure(figsize=(20, 5 * len(rows)), constrained_layout=True)
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(len(rows), 4, squeeze=False)
+        row_idx = 0
+        
+        if top_numeric:
+            row_axes = axes[row_idx]
+            for ax, col in zip(row_axes, top_numeric):
+                _fast_hist(ax, self.df[col])
+                _light_ticks(ax)
+                ax.set_title(f'{col} Distribution', fontweight='bold')
+                ax.set_xlabel(col)
+                ax.set_ylabel('Frequency')
+                ax.grid(alpha=0.3)
             
             # Hide unused subplots
-            for idx in range(len(top_numeric), len(axes)):
-                axes[idx].axis('off')
-            
-            plt.suptitle('Numeric Distributions - Eviden Analysis', 
-                        fontsize=16, fontweight='bold', y=1.00)
-            plt.tight_layout()
+            for ax in row_axes[len(top_numeric):]:
+                ax.axis('off')
+            row_idx += 1
+        
+        if valid_cats:
+            row_axes = axes[row_idx]
+            for ax, col in zip(row_axes, valid_cats):
+                top_values = self._col_for_stats(col).value_counts().head(10)
+                ax.barh(
+                    range(len(top_values)),
+                    top_values.values,
+                    color='#A23B72',
+                    alpha=0.7
+                )
+                ax.set_yticks(range(len(top_values)))
+                ax.set_yticklabels(top_values.index)
+                _light_ticks(ax, y_locator=False)
+                ax.set_title(f'{col} Distribution', fontweight='bold')
+                ax.set_xlabel('Count')
+                ax.grid(alpha=0.3)
             
-            numeric_path = self.output_dir / "numeric_distributions.png"
-            plt.savefig(numeric_path, dpi=300, bbox_inches='tight')
-            plt.close()
-            plots['numeric'] = str(numeric_path)
-        
-        # Top 4 categorical distributions
-        if self.categorical_cols:
-            # Select columns with reasonable number of categories
-            valid_cats = [col for col in self.categorical_cols 
-                         if self.df[col].nunique() <= 20][:4]
-            
-            if valid_cats:
-                fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-                axes = axes.flatten()
-                
-                for idx, col in enumerate(valid_cats):
-                    if idx < len(axes):
-                        top_values = self.df[col].value_counts().head(10)
-                        axes[idx].barh(
-                            range(len(top_values)),
-                            top_values.values,
-                            color='#A23B72',
-                            alpha=0.7
-                        )
-                        axes[idx].set_yticks(range(len(top_values)))
-                        axes[idx].set_yticklabels(top_values.index)
-                        axes[idx].set_title(f'{col} Distribution', fontweight='bold')
-                        axes[idx].set_xlabel('Count')
-                        axes[idx].grid(alpha=0.3)
-                
-                # Hide unused subplots
-                for idx in range(len(valid_cats), len(axes)):
-                    axes[idx].axis('off')
-                
-                plt.suptitle('Categorical Distributions - Eviden Analysis', 
-                            fontsize=16, fontweight='bold', y=1.00)
-                plt.tight_layout()
-                
-                cat_path = self.output_dir / "categorical_distributions.png"
-                plt.savefig(cat_path, dpi=300, bbox_inches='tight')
-                plt.close()
-                plots['categorical'] = str(cat_path)
+            # Hide unused subplots
+            for ax in row_axes[len(valid_cats):]:
+                ax.axis('off')
+        
+        fig.suptitle('Feature Distributions - Eviden Analysis', 
+                     fontsize=16, fontweight='bold')
+        
+        dist_path = self.output_dir / "eda_distributions.png"
+        fig.savefig(dist_path, dpi=self.dpi, bbox_inches=None,
+                    pil_kwargs={'optimize': True})
+        plots['combined'] = str(dist_path)
         
         return plots
     
-    def run_full_eda(self) -> Dict:
+    def generate_visualizations(self) -> Dict:
+        """
+        Render every chart once per engine
+        
+        Safe to call from a background thread: no pyplot state is used, and
+        concurrent callers wait for a single render rather than writing the
+        same files twice.
+        
+        Returns:
+            Visualizations dictionary in the shape used by the EDA summary
+        """
+        with self._plot_lock:
+            return self._cached('visualizations', lambda: {
+                'correlation_heatmap': self.generate_correlation_heatmap(),
+                'distributions': self.generate_distribution_plots()
+            })
+    
+    def run_full_eda(self, generate_plots: bool = True, percentiles: bool = True) -> Dict:
         """
         Execute complete EDA pipeline
         
+        Args:
+            generate_plots: Render chart images; when False the
+                visualization entries are left empty
+            percentiles: Include numeric quartiles in the statistics
+        
         Returns:
             Comprehensive EDA summary dictionary
         """
+        if generate_plots:
+            visualizations = self.generate_visualizations()
+        else:
+            visualizations = {'correlation_heatmap': None, 'distributions': {}}
+        
         summary = {
             'dataset_info': {
                 'rows': len(self.df),
@@ -283,28 +597,36 @@ class EDAEngine:
                 'categorical_columns': len(self.categorical_cols),
                 'datetime_columns': len(self.datetime_cols)
             },
+            'column_types': self.columns._asdict(),
+            'cardinality': {col: int(n) for col, n in self._card.items()},
             'missing_values': self.analyze_missing_values(),
-            'statistics': self.get_column_statistics(),
-            'visualizations': {
-                'correlation_heatmap': self.generate_correlation_heatmap(),
-                'distributions': self.generate_distribution_plots()
-            }
+            'statistics': self.get_column_statistics(percentiles),
+            'visualizations': visualizations
         }
         
         self.eda_summary = summary
         return summary
 
 
-def perform_eda(df: pd.DataFrame, output_dir: str = "reports/assets") -> Dict:
+def perform_eda(
+    df: pd.DataFrame,
+    output_dir: str = "reports/assets",
+    generate_plots: bool = True,
+    dpi: int = 150,
+    percentiles: bool = True
+) -> Dict:
     """
     Convenience function to perform full EDA
     
     Args:
         df: Input DataFrame
         output_dir: Output directory for visualizations
+        generate_plots: Render chart images
+        dpi: Resolution of saved charts
+        percentiles: Include numeric quartiles in the statistics
         
     Returns:
         EDA summary dictionary
     """
-    engine = EDAEngine(df, output_dir)
-    return engine.run_full_eda()
+    engine = EDAEngine(df, output_dir, dpi)
+    return engine.run_full_eda(generate_plots, percentiles)
@@ -6,10 +6,44 @@ This module automatically detects and calculates relevant KPIs
 based on the dataset type and available columns.
 """
 
+import bisect
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
 
+from .utils import SAMPLE_THRESH, ColumnIndex, classify_columns, count_missing
+
+# Row count above which sales KPIs are computed with Polars, if installed
+POLARS_MIN_ROWS = 5_000_000
+
+# Lowercased labels counted as churned in non-numeric churn columns
+_TRUTHY = frozenset({'yes', 'true', '1', 'churned', 'y', 't'})
+
+
+def _num_stats(series: pd.Series, which=('sum', 'mean', 'std')) -> Dict[str, float]:
+    """
+    Compute several reductions of a numeric column from one NaN-free array
+    
+    Args:
+        series: Numeric Series
+        which: Statistics to compute ('sum', 'mean', 'std', 'median')
+        
+    Returns:
+        Dictionary mapping statistic name to value (NaN where undefined)
+    """
+    a = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    a = a[~np.isnan(a)]
+    n = a.size
+    
+    total = float(np.add.reduce(a))
+    mean = total / n if n else np.nan
+    out = {'sum': total, 'mean': mean}
+    if 'std' in which:
+        out['std'] = float(np.sqrt(np.dot(a - mean, a - mean) / (n - 1))) if n > 1 else np.nan
+    if 'median' in which:
+        out['median'] = float(np.median(a)) if n else np.nan
+    return {k: out[k] for k in which}
+
 
 class KPIExtractor:
     """
@@ -19,33 +53,99 @@ class KPIExtractor:
     based on dataset characteristics.
     """
     
-    def __init__(self, df: pd.DataFrame, dataset_type: str = 'general'):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        dataset_type: str = 'general',
+        eda_summary: Optional[Dict] = None
+    ):
         """
         Initialize KPI Extractor
         
         Args:
             df: Input pandas DataFrame
             dataset_type: Type of dataset ('sales', 'finance', 'customer', 'general')
+            eda_summary: Result of perform_eda on the same frame; its column
+                groups, cardinalities and missing counts are reused instead
+                of being recomputed
         """
         self.df = df
         self.dataset_type = dataset_type
+        eda_summary = eda_summary or {}
+        column_types = eda_summary.get('column_types')
+        self.columns = ColumnIndex(**column_types) if column_types else classify_columns(df)
+        self._card = dict(eda_summary.get('cardinality') or {})
+        self._total_missing = eda_summary.get('missing_values', {}).get('total_missing')
+        
+        # Lowercased column names joined into one newline-separated string,
+        # with the start offset of each name, for _find_column
+        self._cols_lower = [(str(col).lower(), col) for col in df.columns]
+        self._cols_text = '\n'.join(low for low, _ in self._cols_lower)
+        self._cols_offsets = []
+        offset = 0
+        for low, _ in self._cols_lower:
+            self._cols_offsets.append(offset)
+            offset += len(low) + 1
+        
+        self._sampled = len(df) > SAMPLE_THRESH
+        self._sample_note = " (sample)" if self._sampled else ""
         self.kpis = {}
+    
+    def _col_for_stats(self, col: str) -> pd.Series:
+        """
+        Column to hash for value counts, sampled on very large frames
+        
+        Args:
+            col: Column name
+            
+        Returns:
+            The full column, or a SAMPLE_THRESH-row random sample of it;
+            categoricals keep only the categories that occur
+        """
+        series = self.df[col]
+        if self._sampled:
+            series = series.sample(n=SAMPLE_THRESH, random_state=0)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # value_counts lists every category, including ones with no rows
+            series = series.cat.remove_unused_categories()
+        return series
+    
+    def _nunique(self, col: str) -> int:
+        """
+        Number of distinct values in a column, reusing EDA cardinalities
+        
+        Counted on the stats sample for very large frames, like the EDA
+        cardinalities it reuses.
+        
+        Args:
+            col: Column name
+            
+        Returns:
+            Count of unique non-null values
+        """
+        if col not in self._card:
+            self._card[col] = int(self._col_for_stats(col).nunique())
+        return self._card[col]
         
     def _find_column(self, keywords: List[str]) -> Optional[str]:
         """
         Find column matching any of the keywords (case-insensitive)
         
+        Earlier keywords take priority; among columns matching the same
+        keyword the first one wins. Each keyword costs one substring scan
+        of the joined column names instead of a Python loop over columns.
+        
         Args:
             keywords: List of keyword patterns to search
             
         Returns:
             Matched column name or None
         """
-        cols_lower = {col.lower(): col for col in self.df.columns}
         for keyword in keywords:
-            for col_lower, col_original in cols_lower.items():
-                if keyword in col_lower:
-                    return col_original
+            pos = self._cols_text.find(keyword)
+            if pos >= 0:
+                idx = bisect.bisect_right(self._cols_offsets, pos) - 1
+                return self._cols_lower[idx][1]
         return None
     
     def extract_sales_kpis(self) -> Dict:
@@ -65,31 +165,37 @@ class KPIExtractor:
         date_col = self._find_column(['date', 'time', 'timestamp'])
         
         # Total Revenue/Sales
-        if revenue_col and pd.api.types.is_numeric_dtype(self.df[revenue_col]):
-            kpis['Total Revenue'] = f"${self.df[revenue_col].sum():,.2f}"
-            kpis['Average Order Value'] = f"${self.df[revenue_col].mean():,.2f}"
-            kpis['Revenue Std Dev'] = f"${self.df[revenue_col].std():,.2f}"
+        series = self.df[revenue_col] if revenue_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            stats = _num_stats(series, ('sum', 'mean', 'std'))
+            kpis['Total Revenue'] = f"${stats['sum']:,.2f}"
+            kpis['Average Order Value'] = f"${stats['mean']:,.2f}"
+            kpis['Revenue Std Dev'] = f"${stats['std']:,.2f}"
         
         # Quantity Metrics
-        if quantity_col and pd.api.types.is_numeric_dtype(self.df[quantity_col]):
-            kpis['Total Units Sold'] = f"{self.df[quantity_col].sum():,.0f}"
-            kpis['Avg Units per Transaction'] = f"{self.df[quantity_col].mean():.2f}"
+        series = self.df[quantity_col] if quantity_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            total, mean = series.sum(), series.mean()
+            kpis['Total Units Sold'] = f"{total:,.0f}"
+            kpis['Avg Units per Transaction'] = f"{mean:.2f}"
         
         # Product Metrics
         if product_col:
-            kpis['Unique Products'] = f"{self.df[product_col].nunique():,}"
-            top_product = self.df[product_col].value_counts().iloc[0]
-            top_product_name = self.df[product_col].value_counts().index[0]
-            kpis['Top Product'] = f"{top_product_name} ({top_product} sales)"
+            vc = self._col_for_stats(product_col).value_counts()
+            kpis['Unique Products'] = f"{len(vc):,}{self._sample_note}"
+            kpis['Top Product'] = f"{vc.index[0]} ({vc.iat[0]} sales){self._sample_note}"
         
         # Profit Margin
-        if margin_col and pd.api.types.is_numeric_dtype(self.df[margin_col]):
-            kpis['Average Margin'] = f"{self.df[margin_col].mean():.2f}%"
-            kpis['Margin Range'] = f"{self.df[margin_col].min():.2f}% - {self.df[margin_col].max():.2f}%"
+        series = self.df[margin_col] if margin_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            mean, lo, hi = series.mean(), series.min(), series.max()
+            kpis['Average Margin'] = f"{mean:.2f}%"
+            kpis['Margin Range'] = f"{lo:.2f}% - {hi:.2f}%"
         
         # Time-based metrics
-        if date_col and pd.api.types.is_datetime64_any_dtype(self.df[date_col]):
-            date_range = (self.df[date_col].max() - self.df[date_col].min()).days
+        series = self.df[date_col] if date_col else None
+        if series is not None and pd.api.types.is_datetime64_any_dtype(series):
+            date_range = (series.max() - series.min()).days
             kpis['Data Period'] = f"{date_range} days"
             if date_range > 0:
                 kpis['Avg Transactions per Day'] = f"{len(self.df) / date_range:.2f}"
@@ -113,23 +219,35 @@ class KPIExtractor:
         transaction_col = self._find_column(['transaction', 'type', 'category'])
         
         # Balance metrics
-        if balance_col and pd.api.types.is_numeric_dtype(self.df[balance_col]):
-            kpis['Total Balance'] = f"${self.df[balance_col].sum():,.2f}"
-            kpis['Average Balance'] = f"${self.df[balance_col].mean():,.2f}"
-            kpis['Median Balance'] = f"${self.df[balance_col].median():,.2f}"
+        series = self.df[balance_col] if balance_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            stats = _num_stats(series, ('sum', 'mean', 'median'))
+            kpis['Total Balance'] = f"${stats['sum']:,.2f}"
+            kpis['Average Balance'] = f"${stats['mean']:,.2f}"
+            kpis['Median Balance'] = f"${stats['median']:,.2f}"
         
         # Debit/Credit analysis
-        if debit_col and pd.api.types.is_numeric_dtype(self.df[debit_col]):
-            kpis['Total Debits'] = f"${self.df[debit_col].sum():,.2f}"
-            kpis['Average Debit'] = f"${self.df[debit_col].mean():,.2f}"
+        debit = self.df[debit_col] if debit_col else None
+        credit = self.df[credit_col] if credit_col else None
+        total_debit = total_credit = None
         
-        if credit_col and pd.api.types.is_numeric_dtype(self.df[credit_col]):
-            kpis['Total Credits'] = f"${self.df[credit_col].sum():,.2f}"
-            kpis['Average Credit'] = f"${self.df[credit_col].mean():,.2f}"
+        if debit is not None and pd.api.types.is_numeric_dtype(debit):
+            total_debit, mean = debit.sum(), debit.mean()
+            kpis['Total Debits'] = f"${total_debit:,.2f}"
+            kpis['Average Debit'] = f"${mean:,.2f}"
+        
+        if credit is not None and pd.api.types.is_numeric_dtype(credit):
+            total_credit, mean = credit.sum(), credit.mean()
+            kpis['Total Credits'] = f"${total_credit:,.2f}"
+            kpis['Average Credit'] = f"${mean:,.2f}"
         
         # Net position
-        if debit_col and credit_col:
-            net_position = self.df[credit_col].sum() - self.df[debit_col].sum()
+        if debit is not None and credit is not None:
+            if total_debit is None:
+                total_debit = debit.sum()
+            if total_credit is None:
+                total_credit = credit.sum()
+            net_position = total_credit - total_debit
             kpis['Net Position'] = f"${net_position:,.2f}"
         
         # Account metrics
@@ -138,9 +256,9 @@ class KPIExtractor:
         
         # Transaction types
         if transaction_col:
-            kpis['Transaction Types'] = f"{self.df[transaction_col].nunique()}"
-            top_transaction = self.df[transaction_col].value_counts().index[0]
-            kpis['Most Common Transaction'] = str(top_transaction)
+            vc = self._col_for_stats(transaction_col).value_counts()
+            kpis['Transaction Types'] = f"{len(vc)}{self._sample_note}"
+            kpis['Most Common Transaction'] = f"{vc.index[0]}{self._sample_note}"
         
         return kpis
     
@@ -166,33 +284,42 @@ class KPIExtractor:
         
         # Churn analysis
         if churn_col:
-            if pd.api.types.is_numeric_dtype(self.df[churn_col]):
-                churn_rate = (self.df[churn_col].sum() / len(self.df)) * 100
+            series = self.df[churn_col]
+            if pd.api.types.is_numeric_dtype(series):
+                churn_rate = (series.sum() / len(self.df)) * 100
             else:
-                # Assume binary (Yes/No, True/False, 1/0)
-                churned_count = self.df[churn_col].astype(str).str.lower().isin(['yes', 'true', '1', 'churned']).sum()
+                # Assume binary (Yes/No, True/False, 1/0): normalise each
+                # distinct label once rather than every row
+                vc = series.value_counts(dropna=False)
+                churned_count = sum(n for label, n in vc.items()
+                                    if str(label).strip().lower() in _TRUTHY)
                 churn_rate = (churned_count / len(self.df)) * 100
             
             kpis['Churn Rate'] = f"{churn_rate:.2f}%"
             kpis['Retention Rate'] = f"{100 - churn_rate:.2f}%"
         
         # Age/Tenure metrics
-        if age_col and pd.api.types.is_numeric_dtype(self.df[age_col]):
-            kpis['Average Age/Tenure'] = f"{self.df[age_col].mean():.1f}"
-            kpis['Age/Tenure Range'] = f"{self.df[age_col].min():.0f} - {self.df[age_col].max():.0f}"
+        series = self.df[age_col] if age_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            mean, lo, hi = series.mean(), series.min(), series.max()
+            kpis['Average Age/Tenure'] = f"{mean:.1f}"
+            kpis['Age/Tenure Range'] = f"{lo:.0f} - {hi:.0f}"
         
         # Segmentation
         if segment_col:
-            kpis['Customer Segments'] = f"{self.df[segment_col].nunique()}"
-            top_segment = self.df[segment_col].value_counts().index[0]
-            top_segment_pct = (self.df[segment_col].value_counts().iloc[0] / len(self.df)) * 100
-            kpis['Largest Segment'] = f"{top_segment} ({top_segment_pct:.1f}%)"
+            series = self._col_for_stats(segment_col)
+            vc = series.value_counts()
+            kpis['Customer Segments'] = f"{len(vc)}{self._sample_note}"
+            top_segment_pct = (vc.iat[0] / len(series)) * 100
+            kpis['Largest Segment'] = f"{vc.index[0]} ({top_segment_pct:.1f}%){self._sample_note}"
         
         # Customer value
-        if value_col and pd.api.types.is_numeric_dtype(self.df[value_col]):
-            kpis['Avg Customer Value'] = f"${self.df[value_col].mean():,.2f}"
-            kpis['Total Customer Value'] = f"${self.df[value_col].sum():,.2f}"
-            kpis['Median Customer Value'] = f"${self.df[value_col].median():,.2f}"
+        series = self.df[value_col] if value_col else None
+        if series is not None and pd.api.types.is_numeric_dtype(series):
+            stats = _num_stats(series, ('mean', 'sum', 'median'))
+            kpis['Avg Customer Value'] = f"${stats['mean']:,.2f}"
+            kpis['Total Customer Value'] = f"${stats['sum']:,.2f}"
+            kpis['Median Customer Value'] = f"${stats['median']:,.2f}"
         
         return kpis
     
@@ -211,12 +338,14 @@ class KPIExtractor:
         
         # Missing data
         total_cells = len(self.df) * len(self.df.columns)
-        missing_cells = self.df.isnull().sum().sum()
+        missing_cells = self._total_missing
+        if missing_cells is None:
+            missing_cells = int(count_missing(self.df).sum())
         completeness = ((total_cells - missing_cells) / total_cells) * 100
         kpis['Data Completeness'] = f"{completeness:.2f}%"
         
         # Numeric column summary
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
+        numeric_cols = self.columns.numeric
         if len(numeric_cols) > 0:
             # Find column with highest mean
             means = self.df[numeric_cols].mean()
@@ -224,12 +353,14 @@ class KPIExtractor:
             kpis[f'Highest Avg ({top_numeric})'] = f"{means[top_numeric]:,.2f}"
         
         # Categorical diversity
-        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        categorical_cols = self.columns.categorical
         if len(categorical_cols) > 0:
-            diversity_scores = {col: self.df[col].nunique() / len(self.df) 
+            diversity_scores = {col: self._nunique(col) / len(self.df) 
                               for col in categorical_cols}
             most_diverse = max(diversity_scores, key=diversity_scores.get)
-            kpis['Most Diverse Column'] = f"{most_diverse} ({self.df[most_diverse].nunique()} unique)"
+            kpis['Most Diverse Column'] = (
+                f"{most_diverse} ({self._nunique(most_diverse)} unique){self._sample_note}"
+            )
         
         return kpis
     
@@ -255,16 +386,30 @@ class KPIExtractor:
         return self.kpis
 
 
-def extract_kpis(df: pd.DataFrame, dataset_type: str = 'general') -> Dict:
+def extract_kpis(
+    df: pd.DataFrame,
+    dataset_type: str = 'general',
+    eda_summary: Optional[Dict] = None
+) -> Dict:
     """
     Convenience function to extract KPIs
     
+    Frames larger than POLARS_MIN_ROWS use the Polars backend when it is
+    installed.
+    
     Args:
         df: Input DataFrame
         dataset_type: Type of dataset
+        eda_summary: Optional perform_eda result for the same frame
         
     Returns:
         KPI dictionary
     """
-    extractor = KPIExtractor(df, dataset_type)
+    extractor_cls = KPIExtractor
+    if len(df) > POLARS_MIN_ROWS:
+        from .kpi_extractor_polars import POLARS_AVAILABLE, PolarsKPIExtractor
+        if POLARS_AVAILABLE:
+            extractor_cls = PolarsKPIExtractor
+    
+    extractor = extractor_cls(df, dataset_type, eda_summary)
     return extractor.extract_all_kpis()
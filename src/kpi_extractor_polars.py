@@ -0,0 +1,110 @@
+"""
+KPI Extractor (Polars backend) - Single-scan KPIs for large datasets
+Eviden (Created by Algorzen)
+
+This module computes the sales KPIs as one Polars lazy query, so all
+aggregations share a single multithreaded scan over Arrow buffers.
+Other dataset types fall back to the pandas implementation.
+"""
+
+import pandas as pd
+from typing import Dict
+
+from .kpi_extractor import KPIExtractor
+
+# Try to import Polars (optional)
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+
+class PolarsKPIExtractor(KPIExtractor):
+    """
+    KPI extractor that evaluates sales aggregations with Polars
+    
+    Column detection and KPI formatting are inherited from KPIExtractor;
+    only the reductions move to a single Polars query plan.
+    """
+    
+    def _is_numeric(self, col) -> bool:
+        """Whether col was found and holds a numeric dtype"""
+        return col is not None and pd.api.types.is_numeric_dtype(self.df[col])
+    
+    def extract_sales_kpis(self) -> Dict:
+        """
+        Extract sales-specific KPIs in one Polars scan
+        
+        Returns:
+            Dictionary of sales KPIs
+        """
+        kpis = {}
+        
+        # Find relevant columns
+        revenue_col = self._find_column(['revenue', 'sales', 'total', 'amount'])
+        quantity_col = self._find_column(['quantity', 'qty', 'units'])
+        product_col = self._find_column(['product', 'item', 'sku'])
+        margin_col = self._find_column(['margin', 'profit'])
+        date_col = self._find_column(['date', 'time', 'timestamp'])
+        
+        has_date = date_col is not None and pd.api.types.is_datetime64_any_dtype(self.df[date_col])
+        
+        # Build every aggregation into one query
+        exprs = []
+        if self._is_numeric(revenue_col):
+            rev = pl.col(revenue_col)
+            exprs += [rev.sum().alias('rev_sum'), rev.mean().alias('rev_mean'), rev.std().alias('rev_std')]
+        if self._is_numeric(quantity_col):
+            qty = pl.col(quantity_col)
+            exprs += [qty.sum().alias('qty_sum'), qty.mean().alias('qty_mean')]
+        if product_col:
+            prod = pl.col(product_col).drop_nulls()
+            exprs += [
+                prod.n_unique().alias('prod_unique'),
+                prod.value_counts(sort=True).first().alias('prod_top')
+            ]
+        if self._is_numeric(margin_col):
+            margin = pl.col(margin_col)
+            exprs += [margin.mean().alias('margin_mean'), margin.min().alias('margin_min'),
+                      margin.max().alias('margin_max')]
+        if has_date:
+            exprs += [pl.col(date_col).min().alias('date_min'), pl.col(date_col).max().alias('date_max')]
+        
+        if not exprs:
+            return kpis
+        
+        used = [col for col in dict.fromkeys((revenue_col, quantity_col, product_col, margin_col, date_col))
+                if col is not None]
+        row = pl.from_pandas(self.df[used]).lazy().select(exprs).collect().row(0, named=True)
+        
+        # Total Revenue/Sales
+        if 'rev_sum' in row:
+            kpis['Total Revenue'] = f"${row['rev_sum']:,.2f}"
+            kpis['Average Order Value'] = f"${row['rev_mean']:,.2f}"
+            kpis['Revenue Std Dev'] = f"${row['rev_std']:,.2f}"
+        
+        # Quantity Metrics
+        if 'qty_sum' in row:
+            kpis['Total Units Sold'] = f"{row['qty_sum']:,.0f}"
+            kpis['Avg Units per Transaction'] = f"{row['qty_mean']:.2f}"
+        
+        # Product Metrics
+        if 'prod_unique' in row and row['prod_top'] is not None:
+            top_name, top_count = list(row['prod_top'].values())[:2]
+            kpis['Unique Products'] = f"{row['prod_unique']:,}"
+            kpis['Top Product'] = f"{top_name} ({top_count} sales)"
+        
+        # Profit Margin
+        if 'margin_mean' in row:
+            kpis['Average Margin'] = f"{row['margin_mean']:.2f}%"
+            kpis['Margin Range'] = f"{row['margin_min']:.2f}% - {row['margin_max']:.2f}%"
+        
+        # Time-based metrics
+        if has_date:
+            date_range = (row['date_max'] - row['date_min']).days
+            kpis['Data Period'] = f"{date_range} days"
+            if date_range > 0:
+                kpis['Avg Transactions per Day'] = f"{len(self.df) / date_range:.2f}"
+        
+        return kpis
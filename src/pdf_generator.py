@@ -9,17 +9,135 @@ KPIs, and AI-generated narratives with executive-level presentation quality.
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+from reportlab import rl_config
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak,
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image, PageBreak,
     Table, TableStyle, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
+from reportlab.lib.utils import ImageReader
+from PIL import Image as PILImage
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-import json
+from functools import lru_cache
+from .utils import save_summary_json
+
+
+# Write binary (Flate-only) streams. ASCII85 wrapping runs in pure Python
+# without the optional C accelerator and was the single largest cost of
+# build() on chart-heavy reports, while also inflating streams by 25%
+rl_config.useA85 = 0
+
+
+@lru_cache(maxsize=None)
+def _hex(value: str) -> colors.Color:
+    """
+    Memoized colors.HexColor - the palette is small and fixed
+    """
+    return colors.HexColor(value)
+
+
+@lru_cache(maxsize=4)
+def _flattened_logo(path: str) -> PILImage.Image:
+    """
+    Load a logo flattened onto the white page background
+    
+    Without an alpha channel the page header can be drawn without
+    mask='auto', which otherwise derives a transparency mask from the
+    logo's pixels. The decoded image is cached; each report wraps it in
+    its own ImageReader, which is not safe to share.
+    
+    Args:
+        path: Path to the logo image
+        
+    Returns:
+        RGB copy of the logo
+    """
+    with PILImage.open(path) as logo:
+        logo = logo.convert('RGBA')
+    flat = PILImage.new('RGB', logo.size, (255, 255, 255))
+    flat.paste(logo, mask=logo.getchannel('A'))
+    return flat
+
+
+# Custom paragraph styles are identical for every report, so build them once
+# at import and share them between templates
+_BASE_STYLES = getSampleStyleSheet()
+_CUSTOM_STYLES = [
+    # Title Style
+    ParagraphStyle(
+        name='AlgorzenTitle',
+        parent=_BASE_STYLES['Heading1'],
+        fontSize=24,
+        textColor=_hex('#1a1a2e'),
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ),
+    # Title Style
+    ParagraphStyle(
+        name='EvidenTitle',
+        parent=_BASE_STYLES['Heading1'],
+        fontSize=24,
+        textColor=_hex('#1a1a2e'),
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ),
+    # Subtitle Style
+    ParagraphStyle(
+        name='EvidenSubtitle',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=12,
+        textColor=_hex('#16213e'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica'
+    ),
+    # Section Header
+    ParagraphStyle(
+        name='EvidenSection',
+        parent=_BASE_STYLES['Heading2'],
+        fontSize=16,
+        textColor=_hex('#0f3460'),
+        spaceAfter=12,
+        spaceBefore=20,
+        fontName='Helvetica-Bold',
+        borderWidth=1,
+        borderColor=_hex('#e94560'),
+        borderPadding=5,
+        backColor=_hex('#f0f0f0')
+    ),
+    # Body Text
+    ParagraphStyle(
+        name='EvidenBody',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=10,
+        textColor=_hex('#222222'),
+        spaceAfter=8,
+        fontName='Helvetica'
+    ),
+    # KPI Table
+    ParagraphStyle(
+        name='EvidenKPI',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=10,
+        textColor=_hex('#e94560'),
+        fontName='Helvetica-Bold'
+    ),
+    # Image Caption
+    ParagraphStyle(
+        name='ImageCaption',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=9,
+        textColor=_hex('#666666'),
+        alignment=TA_CENTER,
+        spaceAfter=12
+    ),
+]
 
 
 class EvidenReportTemplate:
@@ -37,11 +155,20 @@ class EvidenReportTemplate:
         """
         self.filename = filename
         self.author = author
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.date_readable = datetime.now().strftime("%B %d, %Y")
+        now = datetime.now()
+        self.timestamp = now.strftime("%Y%m%d_%H%M%S")
+        self.date_readable = now.strftime("%B %d, %Y")
+        # Footer text is fixed for the whole report; only the page number varies
+        self._footer_left = f"© 2025 Eviden | Author: {self.author}"
+        self._footer_suffix = f" | Generated: {self.date_readable}"
         self.logo_path = str(Path(__file__).parent.parent / "assets" / "eviden_logo.png")
+        # Decode the logo once; every page callback reuses the same reader
+        try:
+            self._logo_reader = ImageReader(_flattened_logo(self.logo_path))
+        except Exception:
+            self._logo_reader = None
         # Create document
-        self.doc = SimpleDocTemplate(
+        self.doc = BaseDocTemplate(
             filename,
             pagesize=letter,
             rightMargin=0.75*inch,
@@ -49,6 +176,17 @@ class EvidenReportTemplate:
             topMargin=1*inch,
             bottomMargin=0.75*inch
         )
+        # One page template (single frame + branding callback) for every page
+        frame = Frame(
+            self.doc.leftMargin,
+            self.doc.bottomMargin,
+            self.doc.width,
+            self.doc.height,
+            id='normal'
+        )
+        self.doc.addPageTemplates([
+            PageTemplate(id='main', frames=[frame], onPage=self._header_footer, pagesize=letter)
+        ])
         self.story = []
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
@@ -57,68 +195,9 @@ class EvidenReportTemplate:
         """
         Setup custom paragraph styles
         """
-        # Title Style
-        self.styles.add(ParagraphStyle(
-            name='AlgorzenTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a1a2e'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Title Style
-        self.styles.add(ParagraphStyle(
-            name='EvidenTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a1a2e'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        # Subtitle Style
-        self.styles.add(ParagraphStyle(
-            name='EvidenSubtitle',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#16213e'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        ))
-        # Section Header
-        self.styles.add(ParagraphStyle(
-            name='EvidenSection',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#0f3460'),
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold',
-            borderWidth=1,
-            borderColor=colors.HexColor('#e94560'),
-            borderPadding=5,
-            backColor=colors.HexColor('#f0f0f0')
-        ))
-        # Body Text
-        self.styles.add(ParagraphStyle(
-            name='EvidenBody',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#222222'),
-            spaceAfter=8,
-            fontName='Helvetica'
-        ))
-        # KPI Table
-        self.styles.add(ParagraphStyle(
-            name='EvidenKPI',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            textColor=colors.HexColor('#e94560'),
-            fontName='Helvetica-Bold'
-        ))
+        for style in _CUSTOM_STYLES:
+            if style.name not in self.styles.byName:
+                self.styles.add(style)
     
     def _header_footer(self, canvas_obj, doc):
         """
@@ -126,27 +205,27 @@ class EvidenReportTemplate:
         """
         canvas_obj.saveState()
         # Header: Eviden logo
-        try:
+        if self._logo_reader is not None:
             logo_width = 1.2 * inch
             logo_height = 0.45 * inch
-            canvas_obj.drawImage(self.logo_path, 0.75*inch, letter[1] - 0.7*inch, width=logo_width, height=logo_height, mask='auto')
-        except Exception:
+            canvas_obj.drawImage(self._logo_reader, 0.75*inch, letter[1] - 0.7*inch, width=logo_width, height=logo_height)
+        else:
             # fallback to text if logo missing
             canvas_obj.setFont('Helvetica-Bold', 12)
-            canvas_obj.setFillColor(colors.HexColor('#1a1a2e'))
+            canvas_obj.setFillColor(_hex('#1a1a2e'))
             canvas_obj.drawString(0.75*inch, letter[1] - 0.5*inch, "Eviden — Insight Reporter")
         # Footer
         canvas_obj.setFont('Helvetica', 8)
-        canvas_obj.setFillColor(colors.HexColor('#666666'))
+        canvas_obj.setFillColor(_hex('#666666'))
         canvas_obj.drawString(
             0.75*inch,
             0.5*inch,
-            f"© 2025 Eviden | Author: {self.author}"
+            self._footer_left
         )
         canvas_obj.drawRightString(
             letter[0] - 0.75*inch,
             0.5*inch,
-            f"Page {doc.page} | Generated: {self.date_readable}"
+            "Page " + str(doc.page) + self._footer_suffix
         )
         canvas_obj.restoreState()
     
@@ -195,13 +274,13 @@ class EvidenReportTemplate:
         metadata_table.setStyle(TableStyle([
             ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
             ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0f3460')),
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#2a2a2a')),
+            ('TEXTCOLOR', (0, 0), (0, -1), _hex('#0f3460')),
+            ('TEXTCOLOR', (1, 0), (1, -1), _hex('#2a2a2a')),
             ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
             ('ALIGN', (1, 0), (1, -1), 'LEFT'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f0f0')),
+            ('GRID', (0, 0), (-1, -1), 0.5, _hex('#cccccc')),
+            ('BACKGROUND', (0, 0), (0, -1), _hex('#f0f0f0')),
             ('PADDING', (0, 0), (-1, -1), 8),
         ]))
         
@@ -220,13 +299,13 @@ class EvidenReportTemplate:
         self.story.append(section_title)
         self.story.append(Spacer(1, 0.15*inch))
         
-        # Split content into paragraphs
-        paragraphs = content.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                p = Paragraph(para.strip(), self.styles['EvidenBody'])
-                self.story.append(p)
-                self.story.append(Spacer(1, 0.1*inch))
+        # One flowable per section: blank-line paragraph breaks become inline
+        # breaks, so long narratives don't add a Paragraph + Spacer per chunk
+        paragraphs = [para.strip() for para in content.split('\n\n') if para.strip()]
+        if paragraphs:
+            body = '<br/><br/>'.join(paragraphs)
+            self.story.append(Paragraph(body, self.styles['EvidenBody']))
+            self.story.append(Spacer(1, 0.1*inch))
     
     def add_kpi_section(self, kpis: Dict):
         """
@@ -248,7 +327,7 @@ class EvidenReportTemplate:
         kpi_table.setStyle(TableStyle([
             # Header
             ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 11),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0f3460')),
+            ('BACKGROUND', (0, 0), (-1, 0), _hex('#0f3460')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
             ('PADDING', (0, 0), (-1, 0), 10),
@@ -256,20 +335,26 @@ class EvidenReportTemplate:
             # Body
             ('FONT', (0, 1), (-1, -1), 'Helvetica', 10),
             ('FONT', (0, 1), (0, -1), 'Helvetica-Bold', 10),
-            ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#0f3460')),
-            ('TEXTCOLOR', (1, 1), (1, -1), colors.HexColor('#2a2a2a')),
+            ('TEXTCOLOR', (0, 1), (0, -1), _hex('#0f3460')),
+            ('TEXTCOLOR', (1, 1), (1, -1), _hex('#2a2a2a')),
             ('ALIGN', (0, 1), (0, -1), 'LEFT'),
             ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
             ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+            ('GRID', (0, 0), (-1, -1), 0.5, _hex('#cccccc')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, _hex('#f9f9f9')]),
             ('PADDING', (0, 1), (-1, -1), 8),
         ]))
         
         self.story.append(kpi_table)
         self.story.append(Spacer(1, 0.3*inch))
     
-    def add_image(self, image_path: str, width: float = 6.5, caption: Optional[str] = None):
+    def add_image(
+        self,
+        image_path: str,
+        width: float = 6.5,
+        caption: Optional[str] = None,
+        height_ratio: Optional[float] = 0.75
+    ):
         """
         Add image to report
         
@@ -277,32 +362,35 @@ class EvidenReportTemplate:
             image_path: Path to image file
             width: Image width in inches
             caption: Optional image caption
+            height_ratio: Height as a fraction of width; None keeps the
+                image's own aspect ratio
         """
-        if Path(image_path).exists():
-            img = Image(image_path, width=width*inch, height=width*0.75*inch)
-            self.story.append(img)
-            
-            if caption:
-                cap = Paragraph(
-                    f"<i>{caption}</i>",
-                    ParagraphStyle(
-                        'ImageCaption',
-                        parent=self.styles['Normal'],
-                        fontSize=9,
-                        textColor=colors.HexColor('#666666'),
-                        alignment=TA_CENTER,
-                        spaceAfter=12
-                    )
-                )
-                self.story.append(cap)
-            
-            self.story.append(Spacer(1, 0.2*inch))
+        # Header-only probe: doubles as the existence check and gives the
+        # pixel size without decoding the image
+        try:
+            with PILImage.open(image_path) as probe:
+                px_width, px_height = probe.size
+        except OSError:
+            return
+        
+        if height_ratio is None:
+            height_ratio = px_height / px_width
+        # lazy=2 defers the decode to layout and drops it straight after,
+        # so chart pixels are not all held in memory until build()
+        img = Image(image_path, width=width*inch, height=width*height_ratio*inch, lazy=2)
+        self.story.append(img)
+        
+        if caption:
+            cap = Paragraph(f"<i>{caption}</i>", self.styles['ImageCaption'])
+            self.story.append(cap)
+        
+        self.story.append(Spacer(1, 0.2*inch))
     
     def build(self):
         """
         Build the final PDF
         """
-        self.doc.build(self.story, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
+        self.doc.build(self.story)
 
 
 def generate_pdf_report(
@@ -360,23 +448,20 @@ def generate_pdf_report(
         report.add_section("Correlation Analysis", 
                           "The following heatmap illustrates relationships between numeric variables, "
                           "identifying potential dependencies and optimization opportunities.")
-        report.add_image(heatmap_path, caption="Feature Correlation Matrix")
+        report.add_image(heatmap_path, caption="Feature Correlation Matrix", height_ratio=None)
     
     # Distribution plots
     distributions = visualizations.get('distributions', {})
     
-    if distributions.get('numeric') and Path(distributions['numeric']).exists():
+    if distributions.get('combined') and Path(distributions['combined']).exists():
         report.story.append(PageBreak())
-        report.add_section("Numeric Distributions",
+        report.add_section("Feature Distributions",
                           "Distribution analysis of key numeric features reveals patterns in "
-                          "central tendency, spread, and potential outliers.")
-        report.add_image(distributions['numeric'], caption="Numeric Feature Distributions")
-    
-    if distributions.get('categorical') and Path(distributions['categorical']).exists():
-        report.add_section("Categorical Distributions",
-                          "Categorical feature analysis identifies dominant segments and "
-                          "distribution imbalances requiring strategic attention.")
-        report.add_image(distributions['categorical'], caption="Categorical Feature Distributions")
+                          "central tendency, spread, and potential outliers, while categorical "
+                          "feature analysis identifies dominant segments and distribution "
+                          "imbalances requiring strategic attention.")
+        report.add_image(distributions['combined'], caption="Numeric (top) and Categorical "
+                         "(bottom) Feature Distributions", height_ratio=None)
     
     # Add data quality section
     report.story.append(PageBreak())
@@ -397,21 +482,18 @@ def generate_pdf_report(
     # Build PDF
     report.build()
     
-    # Generate metadata JSON
+    # Generate metadata JSON only once the PDF it points at exists
     metadata = {
         "project": "Eviden Insight Reporter",
         "report_id": f"EVD-2025-Q4-{timestamp}",
         "generated_by": author,
         "created_at": datetime.now().isoformat(),
         "tone": "Executive Business",
-        "openai_used": narrative.get('method') == 'gpt-4',
+        "openai_used": narrative.get('method') in ('gpt-4', 'cache'),
         "dataset_type": dataset_info.get('dataset_type', 'general'),
         "record_count": dataset_info.get('rows', 0),
         "pdf_file": str(filename)
     }
-    
-    metadata_file = output_path / "report_metadata.json"
-    with open(metadata_file, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    save_summary_json(metadata, output_path / "report_metadata.json")
     
     return str(filename)
@@ -8,16 +8,56 @@ Common utility functions used across the application.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, List, NamedTuple, Optional, Union
 import json
+import re
 
+# Try to import PyArrow's CSV/JSON readers (optional fast path)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.json as pa_json
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-def load_dataset(file_path: Union[str, Path]) -> pd.DataFrame:
+# Try to import orjson (optional fast JSON writer)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Block size for the multithreaded Arrow CSV parser (8 MB)
+ARROW_CSV_BLOCK_SIZE = 8 << 20
+
+
+def _read_csv_arrow(file_path: Path) -> pd.DataFrame:
+    """
+    Read CSV with PyArrow's multithreaded parser and hand off to pandas
+    
+    Args:
+        file_path: Path to CSV file
+        
+    Returns:
+        Loaded pandas DataFrame
+    """
+    table = pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=ARROW_CSV_BLOCK_SIZE)
+    )
+    # self_destruct frees Arrow buffers as columns are converted
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def load_dataset(file_path: Union[str, Path], fast_io: bool = True) -> pd.DataFrame:
     """
     Load dataset from various file formats
     
     Args:
         file_path: Path to dataset file
+        fast_io: Use the PyArrow CSV/NDJSON readers when available
         
     Returns:
         Loaded pandas DataFrame
@@ -33,15 +73,97 @@ def load_dataset(file_path: Union[str, Path]) -> pd.DataFrame:
     extension = file_path.suffix.lower()
     
     if extension == '.csv':
+        if fast_io and PYARROW_AVAILABLE:
+            try:
+                return _read_csv_arrow(file_path)
+            except pa.ArrowInvalid:
+                pass  # Irregular CSV; the pandas C parser is more forgiving
         return pd.read_csv(file_path)
     elif extension in ['.xlsx', '.xls']:
         return pd.read_excel(file_path)
     elif extension == '.parquet':
-        return pd.read_parquet(file_path)
+        return pd.read_parquet(file_path, engine='pyarrow')
+    elif extension == '.feather':
+        import pyarrow.feather as feather
+        return feather.read_table(file_path).to_pandas()
     elif extension == '.json':
         return pd.read_json(file_path)
+    elif extension in ['.jsonl', '.ndjson']:
+        # Newline-delimited records parse in parallel blocks with PyArrow
+        if fast_io and PYARROW_AVAILABLE:
+            return pa_json.read_json(file_path).to_pandas(self_destruct=True, split_blocks=True)
+        return pd.read_json(file_path, lines=True)
+    else:
+        raise ValueError(f"Unsupported file format: {extension}")
+
+
+def _csv_ready_table(df: pd.DataFrame) -> 'pa.Table':
+    """
+    Convert a DataFrame to an Arrow table for the native CSV writer
+    
+    Timestamps that are whole seconds are narrowed to second precision so
+    they are written as '2024-01-01 00:00:00', as pandas would, rather than
+    with nine trailing zeros.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        pyarrow.Table without the index
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type) and field.type.unit != 's':
+            try:
+                seconds = table.column(i).cast(pa.timestamp('s', tz=field.type.tz), safe=True)
+            except pa.ArrowInvalid:
+                continue
+            table = table.set_column(i, field.name, seconds)
+    return table
+
+
+def save_dataset(df: pd.DataFrame, output_path: Union[str, Path]) -> Path:
+    """
+    Save dataset in the format implied by the file extension
+    
+    Parquet (Snappy) is the most compact on disk, Feather (LZ4) is the
+    fastest to read back. CSV is only written when explicitly requested, and
+    goes through PyArrow's multithreaded writer when available.
+    
+    Args:
+        df: DataFrame to save
+        output_path: Output file path (.parquet, .feather or .csv)
+        
+    Returns:
+        Path of the written file
+        
+    Raises:
+        ValueError: If file format is unsupported
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    extension = output_path.suffix.lower()
+    
+    if extension == '.parquet':
+        df.to_parquet(output_path, engine='pyarrow', compression='snappy', index=False)
+    elif extension == '.feather':
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        feather.write_feather(
+            pa.Table.from_pandas(df, preserve_index=False),
+            output_path,
+            compression='lz4'
+        )
+    elif extension == '.csv':
+        if PYARROW_AVAILABLE:
+            pa_csv.write_csv(_csv_ready_table(df), output_path)
+        else:
+            df.to_csv(output_path, index=False)
     else:
         raise ValueError(f"Unsupported file format: {extension}")
+    
+    return output_path
 
 
 def save_summary_json(summary: dict, output_path: Union[str, Path]):
@@ -55,6 +177,12 @@ def save_summary_json(summary: dict, output_path: Union[str, Path]):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    if ORJSON_AVAILABLE:
+        # NumPy scalars/arrays and datetimes are encoded natively; str() is
+        # only the fallback for anything orjson doesn't know
+        output_path.write_bytes(orjson.dumps(summary, default=str, option=_ORJSON_OPTIONS))
+        return
+    
     with open(output_path, 'w') as f:
         json.dump(summary, f, indent=2, default=str)
 
@@ -122,10 +250,173 @@ def create_directory_structure(base_path: Union[str, Path]):
         base_path / "src"
     ]
     
+    # Common case after the first run: one stat per directory, no mkdir
+    if all(directory.is_dir() for directory in directories):
+        return
+    
     for directory in directories:
         directory.mkdir(parents=True, exist_ok=True)
 
 
+# Row count above which categorical counts are taken from a random sample
+SAMPLE_THRESH = 1_000_000
+
+# Rows below which numba's JIT warm-up outweighs its kernels' speedup
+NUMBA_MIN_ROWS = 1_000_000
+
+# Characters stripped from column names by clean_column_names
+_COLUMN_NAME_JUNK = re.compile(r'[^A-Za-z0-9_]')
+
+
+class ColumnIndex(NamedTuple):
+    """
+    Column names grouped by broad dtype family
+    """
+    numeric: List[str]
+    categorical: List[str]
+    datetime: List[str]
+
+
+def classify_columns(df: pd.DataFrame) -> ColumnIndex:
+    """
+    Group columns by dtype in a single pass over df.dtypes
+    
+    Replaces repeated select_dtypes calls, which re-scan the dtypes on
+    every call. Booleans are left out of all groups, as before.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        ColumnIndex of (numeric, categorical, datetime) column names
+    """
+    numeric, categorical, datetime = [], [], []
+    
+    for name, dtype in zip(df.columns, df.dtypes.values):
+        kind = dtype.kind
+        if kind in 'iufc':
+            numeric.append(name)
+        elif kind == 'O':
+            # object, category and string dtypes
+            categorical.append(name)
+        elif kind == 'M':
+            datetime.append(name)
+    
+    return ColumnIndex(numeric, categorical, datetime)
+
+
+def count_missing(df: pd.DataFrame) -> pd.Series:
+    """
+    Count missing values per column without a full boolean frame
+    
+    df.isnull().sum() materialises a rows x cols boolean DataFrame first;
+    reducing column by column only ever holds one column's mask. Plain
+    float columns are counted straight from their ndarray with np.isnan,
+    skipping the pandas isna() dispatch and its boolean Series.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        Series of missing counts indexed by column name
+    """
+    counts = []
+    for _, series in df.items():
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            a = series.to_numpy()
+            counts.append(np.count_nonzero(np.isnan(a)))
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'iub':
+            counts.append(0)  # cannot hold missing values
+        else:
+            counts.append(int(series.isna().sum()))
+    
+    return pd.Series(counts, index=df.columns, dtype='int64')
+
+
+def ensure_categorical(series: pd.Series, probe_size: int = 10_000) -> pd.Series:
+    """
+    Convert a low-cardinality object column to the category dtype
+    
+    Counting on category codes avoids re-hashing Python strings on every
+    value_counts/nunique call. Columns whose leading rows are mostly
+    distinct (IDs, free text) are returned unchanged, as categories
+    would only add memory.
+    
+    Args:
+        series: Input Series
+        probe_size: Number of leading rows used to estimate cardinality
+        
+    Returns:
+        Categorical Series, or the original Series
+    """
+    if series.dtype != object:
+        return series
+    
+    probe = series.iloc[:probe_size]
+    if probe.nunique() >= len(probe) / 2:
+        return series
+    
+    return series.astype('category')
+
+
+def downcast_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a freshly loaded DataFrame's dtypes
+    
+    Integer columns are narrowed to the smallest type holding their range
+    and low-cardinality object columns become categories. Floats stay
+    float64 so revenue-style totals keep full precision in the KPIs.
+    
+    Args:
+        df: Input DataFrame (not modified)
+        
+    Returns:
+        DataFrame sharing unchanged columns with the input
+    """
+    df = df.copy(deep=False)
+    for col, dtype in df.dtypes.items():
+        if not isinstance(dtype, np.dtype):
+            continue
+        if dtype.kind == 'i':
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        elif dtype.kind == 'u':
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+        elif dtype.kind == 'O':
+            df[col] = ensure_categorical(df[col])
+    return df
+
+
+def _fast_mem(df: pd.DataFrame) -> int:
+    """
+    Estimate DataFrame memory in bytes without memory_usage(deep=True)
+    
+    Fixed-width columns report their buffer size. Object columns are sized
+    as the pointer array plus 49 + len bytes per string, which is exactly
+    what sys.getsizeof reports for ASCII str and avoids calling it per cell.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        Approximate memory footprint in bytes
+    """
+    total = df.index.memory_usage(deep=df.index.dtype == object)
+    for _, series in df.items():
+        if series.dtype != object:
+            # Categoricals only walk their (small) categories when deep
+            total += series.memory_usage(index=False, deep=series.dtype.kind == 'O')
+            continue
+        values = series.to_numpy()
+        try:
+            lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+            total += values.nbytes + int(lengths.sum()) + 49 * len(values)
+        except TypeError:
+            # Mixed objects (NaN, numbers, ...) - let pandas size them
+            total += series.memory_usage(index=False, deep=True)
+    return int(total)
+
+
 def validate_dataframe(df: pd.DataFrame) -> dict:
     """
     Validate DataFrame and return quality metrics
@@ -143,16 +434,16 @@ def validate_dataframe(df: pd.DataFrame) -> dict:
         }
     
     total_cells = len(df) * len(df.columns)
-    missing_cells = df.isnull().sum().sum()
+    missing_cells = int(count_missing(df).sum())
     
     return {
         'valid': True,
         'rows': len(df),
         'columns': len(df.columns),
         'total_cells': total_cells,
-        'missing_cells': int(missing_cells),
+        'missing_cells': missing_cells,
         'completeness_pct': ((total_cells - missing_cells) / total_cells) * 100,
-        'memory_mb': df.memory_usage(deep=True).sum() / 1024 / 1024
+        'memory_mb': _fast_mem(df) / 1024 / 1024
     }
 
 
@@ -166,46 +457,69 @@ def get_column_info(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with column information
     """
-    info = {
-        'numeric': [],
-        'categorical': [],
-        'datetime': [],
-        'boolean': []
-    }
-    
-    for col in df.columns:
-        dtype = df[col].dtype
-        
+    # Bucket columns by dtype first (metadata only), then run each reduction
+    # once per bucket instead of once per column
+    groups = {'numeric': [], 'categorical': [], 'datetime': [], 'boolean': []}
+    for col, dtype in df.dtypes.items():
         if pd.api.types.is_numeric_dtype(dtype):
-            info['numeric'].append({
-                'name': col,
-                'dtype': str(dtype),
-                'unique': int(df[col].nunique()),
-                'missing': int(df[col].isnull().sum())
-            })
+            groups['numeric'].append(col)
         elif pd.api.types.is_datetime64_any_dtype(dtype):
-            info['datetime'].append({
-                'name': col,
-                'dtype': str(dtype),
-                'min': str(df[col].min()),
-                'max': str(df[col].max()),
-                'missing': int(df[col].isnull().sum())
-            })
+            groups['datetime'].append(col)
         elif pd.api.types.is_bool_dtype(dtype):
-            info['boolean'].append({
-                'name': col,
-                'dtype': str(dtype),
-                'true_count': int(df[col].sum()),
-                'false_count': int((~df[col]).sum()),
-                'missing': int(df[col].isnull().sum())
-            })
+            groups['boolean'].append(col)
         else:
-            info['categorical'].append({
+            groups['categorical'].append(col)
+    
+    info = {kind: [] for kind in groups}
+    dtypes = df.dtypes
+    
+    for kind in ('numeric', 'categorical'):
+        cols = groups[kind]
+        if not cols:
+            continue
+        sub = df[cols]
+        unique = sub.nunique()
+        missing = count_missing(sub)
+        info[kind] = [
+            {
+                'name': col,
+                'dtype': str(dtypes[col]),
+                'unique': int(unique[col]),
+                'missing': int(missing[col])
+            }
+            for col in cols
+        ]
+    
+    cols = groups['datetime']
+    if cols:
+        sub = df[cols]
+        mins, maxs, missing = sub.min(), sub.max(), count_missing(sub)
+        info['datetime'] = [
+            {
+                'name': col,
+                'dtype': str(dtypes[col]),
+                'min': str(mins[col]),
+                'max': str(maxs[col]),
+                'missing': int(missing[col])
+            }
+            for col in cols
+        ]
+    
+    cols = groups['boolean']
+    if cols:
+        sub = df[cols]
+        trues, missing = sub.sum(), count_missing(sub)
+        info['boolean'] = [
+            {
                 'name': col,
-                'dtype': str(dtype),
-                'unique': int(df[col].nunique()),
-                'missing': int(df[col].isnull().sum())
-            })
+                'dtype': str(dtypes[col]),
+                'true_count': int(trues[col]),
+                # Derived from the totals rather than materialising ~df[col]
+                'false_count': int(len(df) - trues[col] - missing[col]),
+                'missing': int(missing[col])
+            }
+            for col in cols
+        ]
     
     return info
 
@@ -220,62 +534,172 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with cleaned column names
     """
-    df = df.copy()
+    # Only the labels change, so a shallow copy is enough - the caller's
+    # frame keeps its names and no column data is duplicated
+    df = df.copy(deep=False)
+    
+    # Spaces become underscores, other special characters are dropped and the
+    # result is lowercased - one pass per name instead of three Index passes
+    df.columns = [
+        _COLUMN_NAME_JUNK.sub('', str(col).replace(' ', '_')).lower()
+        for col in df.columns
+    ]
+    
+    return df
+
+
+_SAMPLE_PRODUCTS = np.array(['Laptop', 'Phone', 'Tablet', 'Monitor', 'Keyboard', 'Mouse', 'Headphones', 'Webcam'], dtype=object)
+_SAMPLE_REGIONS = np.array(['North', 'South', 'East', 'West', 'Central'], dtype=object)
+_SAMPLE_CHANNELS = np.array(['Online', 'Retail', 'Wholesale', 'Partner'], dtype=object)
+_SAMPLE_CATEGORIES = np.array(['Electronics', 'Accessories', 'Peripherals'], dtype=object)
+# Records are spaced every 4 hours from the start date (fixed step, no tz)
+_SAMPLE_START = np.datetime64('2024-01-01T00:00', 'ns')
+_SAMPLE_STEP = np.timedelta64(4, 'h')
+_SAMPLE_COMBINATIONS = len(_SAMPLE_PRODUCTS) * len(_SAMPLE_CATEGORIES) * len(_SAMPLE_REGIONS) * len(_SAMPLE_CHANNELS)
+
+
+def _prefixed_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """
+    Build zero-padded ID strings like 'TXN-000001' without a per-row f-string
     
-    # Replace spaces with underscores
-    df.columns = df.columns.str.replace(' ', '_')
+    Args:
+        prefix: Text placed before the number
+        numbers: Integer array
+        width: Minimum digit count (wider numbers are kept in full)
+        
+    Returns:
+        NumPy unicode array of IDs
+    """
+    # np.char.zfill reduces over the array and fails on an empty one
+    if numbers.size == 0:
+        return np.array([], dtype=str)
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+def _sales_derived_fields(quantity, unit_price, discount_pct):
+    """
+    Compute subtotal, discount amount and revenue with NumPy (three passes)
     
-    # Remove special characters
-    df.columns = df.columns.str.replace('[^A-Za-z0-9_]', '', regex=True)
+    Args:
+        quantity: Integer or float array
+        unit_price: Float array
+        discount_pct: Float array (percent)
+        
+    Returns:
+        Tuple of (subtotal, discount_amount, total_revenue) arrays
+    """
+    subtotal = (quantity * unit_price).round(2)
+    discount_amount = (subtotal * discount_pct / 100).round(2)
+    total_revenue = (subtotal - discount_amount).round(2)
+    return subtotal, discount_amount, total_revenue
+
+
+def _sample_sales_columns(rng: np.random.Generator, start: int, n_records: int) -> dict:
+    """
+    Draw one block of synthetic sales columns
     
-    # Convert to lowercase
-    df.columns = df.columns.str.lower()
+    Args:
+        rng: Random generator (shared across blocks for reproducibility)
+        start: Index of the first record in the block
+        n_records: Number of records in the block
+        
+    Returns:
+        Dictionary mapping column name to array
+    """
+    quantity = rng.integers(1, 50, n_records)
+    customer_nums = rng.integers(1, 500, n_records)
+    
+    # One draw for all three uniform columns (price, discount, margin)
+    uniform = rng.random((3, n_records))
+    unit_price = (10 + 1990 * uniform[0]).round(2)
+    discount_pct = (25 * uniform[1]).round(2)
+    profit_margin = (10 + 30 * uniform[2]).round(2)
+    
+    # One draw for all four categorical columns: a mixed-radix index over
+    # the product of the label counts decodes into independent uniform picks
+    labels = (_SAMPLE_PRODUCTS, _SAMPLE_CATEGORIES, _SAMPLE_REGIONS, _SAMPLE_CHANNELS)
+    combo = rng.integers(0, _SAMPLE_COMBINATIONS, n_records)
+    picks = []
+    for choices in labels:
+        combo, digit = np.divmod(combo, len(choices))
+        picks.append(choices[digit])
+    product, category, region, channel = picks
+    
+    # Calculate derived fields (one fused JIT pass for large blocks). numba
+    # is imported here so that loading utils never pays for it
+    derive = _sales_derived_fields
+    if n_records >= NUMBA_MIN_ROWS:
+        from . import _numba_kernels
+        if _numba_kernels.NUMBA_AVAILABLE:
+            derive = _numba_kernels.sales_derived_fields
+    subtotal, discount_amount, total_revenue = derive(quantity, unit_price, discount_pct)
     
-    return df
+    # Add some missing values randomly
+    missing_indices = rng.choice(n_records, size=int(n_records * 0.02), replace=False)
+    discount_pct[missing_indices] = np.nan
+    
+    return {
+        'transaction_id': _prefixed_ids('TXN-', np.arange(start + 1, start + n_records + 1), 6),
+        'date': _SAMPLE_START + np.arange(start, start + n_records) * _SAMPLE_STEP,
+        'product': product,
+        'category': category,
+        'region': region,
+        'channel': channel,
+        'quantity': quantity,
+        'unit_price': unit_price,
+        'discount_pct': discount_pct,
+        'customer_id': _prefixed_ids('CUST-', customer_nums, 4),
+        'subtotal': subtotal,
+        'discount_amount': discount_amount,
+        'total_revenue': total_revenue,
+        'profit_margin': profit_margin
+    }
 
 
-def generate_sample_sales_data(n_records: int = 1000) -> pd.DataFrame:
+def generate_sample_sales_data(n_records: int = 1000, seed: int = 42, as_arrow: bool = False):
     """
     Generate synthetic sales dataset for testing
     
+    All columns are drawn as whole NumPy arrays and assembled in one step.
+    
     Args:
         n_records: Number of records to generate
+        seed: Random seed for reproducible output
+        as_arrow: Return a pyarrow.Table instead of a DataFrame (for direct Parquet writes)
         
     Returns:
-        DataFrame with synthetic sales data
-    """
-    np.random.seed(42)
-    
-    products = ['Laptop', 'Phone', 'Tablet', 'Monitor', 'Keyboard', 'Mouse', 'Headphones', 'Webcam']
-    regions = ['North', 'South', 'East', 'West', 'Central']
-    channels = ['Online', 'Retail', 'Wholesale', 'Partner']
-    
-    data = {
-        'transaction_id': [f'TXN-{i:06d}' for i in range(1, n_records + 1)],
-        'date': pd.date_range(start='2024-01-01', periods=n_records, freq='4H'),
-        'product': np.random.choice(products, n_records),
-        'category': np.random.choice(['Electronics', 'Accessories', 'Peripherals'], n_records),
-        'region': np.random.choice(regions, n_records),
-        'channel': np.random.choice(channels, n_records),
-        'quantity': np.random.randint(1, 50, n_records),
-        'unit_price': np.random.uniform(10, 2000, n_records).round(2),
-        'discount_pct': np.random.uniform(0, 25, n_records).round(2),
-        'customer_id': [f'CUST-{np.random.randint(1, 500):04d}' for _ in range(n_records)]
-    }
+        DataFrame (or pyarrow.Table) with synthetic sales data
+    """
+    data = _sample_sales_columns(np.random.default_rng(seed), 0, n_records)
     
-    df = pd.DataFrame(data)
+    if as_arrow:
+        import pyarrow as pa
+        return pa.Table.from_pydict(data)
     
-    # Calculate derived fields
-    df['subtotal'] = (df['quantity'] * df['unit_price']).round(2)
-    df['discount_amount'] = (df['subtotal'] * df['discount_pct'] / 100).round(2)
-    df['total_revenue'] = (df['subtotal'] - df['discount_amount']).round(2)
-    df['profit_margin'] = np.random.uniform(10, 40, n_records).round(2)
+    return pd.DataFrame(data)
+
+
+def yield_sample_sales_chunks(n_records: int, chunk_size: int = 1_000_000, seed: int = 42) -> Iterator:
+    """
+    Generate synthetic sales data as a stream of Arrow tables
     
-    # Add some missing values randomly
-    missing_indices = np.random.choice(df.index, size=int(n_records * 0.02), replace=False)
-    df.loc[missing_indices, 'discount_pct'] = np.nan
+    Peak memory is bounded by chunk_size rather than n_records. Output is
+    reproducible for a given (n_records, chunk_size, seed).
     
-    return df
+    Args:
+        n_records: Total number of records to generate
+        chunk_size: Maximum records per chunk
+        seed: Random seed for reproducible output
+        
+    Yields:
+        pyarrow.Table chunks with identical schemas
+    """
+    import pyarrow as pa
+    
+    rng = np.random.default_rng(seed)
+    for start in range(0, max(n_records, 1), chunk_size):
+        n = min(chunk_size, n_records - start)
+        yield pa.Table.from_pydict(_sample_sales_columns(rng, start, n))
 
 
 if __name__ == "__main__":
@@ -283,10 +707,7 @@ if __name__ == "__main__":
     print("Generating sample sales dataset...")
     df = generate_sample_sales_data(1000)
     
-    output_path = Path(__file__).parent.parent / "data" / "sample_dataset.csv"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    df.to_csv(output_path, index=False)
+    output_path = save_dataset(df, Path(__file__).parent.parent / "data" / "sample_dataset.parquet")
     print(f"✓ Sample dataset saved to: {output_path}")
     print(f"  Rows: {len(df):,}")
     print(f"  Columns: {len(df.columns)}")
@@ -9,16 +9,47 @@ and generating comprehensive AI-powered business intelligence reports.
 import streamlit as st
 import pandas as pd
 import sys
+import os
 from pathlib import Path
-import json
+from typing import Optional
+import codecs
+import hashlib
+import io
+from html import escape
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.eda_engine import perform_eda
-from src.kpi_extractor import extract_kpis
-from src.ai_narrator import generate_narrative
-from src.pdf_generator import generate_pdf_report
+# The analysis modules (matplotlib/seaborn, numba, reportlab, openai) are
+# imported where they are first used, so the landing page renders without
+# paying for them
+
+# Try to import charset-normalizer (encoding detection for non-UTF-8 uploads)
+try:
+    from charset_normalizer import from_bytes
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+# Try to import python-calamine (Rust Excel reader, pandas engine='calamine')
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Bytes sampled from the head of an upload to guess its encoding
+ENCODING_PROBE_BYTES = 1 << 20
+
+# WebP quality for charts sent to the browser (the PDF keeps the PNGs)
+CHART_WEBP_QUALITY = 85
+
+# Partial reruns need st.fragment (Streamlit >= 1.37, experimental from 1.33);
+# older releases render the decorated panel as part of the full rerun
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', lambda func: func)
 
 
 # Page configuration
@@ -70,6 +101,11 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
+    .kpi-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 0 1rem;
+    }
     .kpi-box {
         background-color: #f0f0f0;
         padding: 1rem;
@@ -98,16 +134,414 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+def _detect_encoding(uploaded_file) -> str:
+    """
+    Guess the text encoding of an uploaded file from its first megabyte
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile (rewound before returning)
+        
+    Returns:
+        Encoding name, 'utf-8' when it cannot be determined
+    """
+    uploaded_file.seek(0)
+    probe = uploaded_file.read(ENCODING_PROBE_BYTES)
+    uploaded_file.seek(0)
+    
+    # Most uploads are UTF-8; the incremental decoder tolerates a multi-byte
+    # character cut off at the end of the probe
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(probe, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    if not CHARSET_NORMALIZER_AVAILABLE:
+        return 'utf-8'
+    best = from_bytes(probe).best()
+    return best.encoding if best else 'utf-8'
+
+
+def _read_csv_fast(uploaded_file) -> pd.DataFrame:
+    """
+    Read an uploaded CSV with the multithreaded PyArrow parser
+    
+    The encoding is detected up front (PyArrow would otherwise surface
+    non-UTF-8 text as raw bytes). Falls back to the C engine when PyArrow is
+    not installed or rejects the file.
+    
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        
+    Returns:
+        Loaded DataFrame
+    """
+    encoding = _detect_encoding(uploaded_file)
+    try:
+        return pd.read_csv(uploaded_file, engine='pyarrow', encoding=encoding)
+    except (ImportError, ValueError):
+        uploaded_file.seek(0)
+    
+    return pd.read_csv(
+        uploaded_file,
+        engine='c',
+        low_memory=False,
+        cache_dates=True,
+        encoding=encoding
+    )
+
+
+def _read_excel_fast(buffer) -> pd.DataFrame:
+    """
+    Read an Excel workbook with the Rust calamine engine when installed
+    
+    Falls back to pandas' default engine (openpyxl/xlrd) when calamine is
+    missing or cannot parse the file.
+    
+    Args:
+        buffer: File-like object positioned at the start of the workbook
+        
+    Returns:
+        Loaded DataFrame (first sheet)
+    """
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(buffer, engine='calamine')
+        except (ImportError, ValueError):
+            buffer.seek(0)
+    
+    return pd.read_excel(buffer)
+
+
+@st.cache_data(show_spinner=False)
+def load_uploaded_dataset(file_bytes: bytes, name: str) -> pd.DataFrame:
+    """
+    Parse uploaded bytes into a DataFrame (cached on the file contents)
+    
+    Args:
+        file_bytes: Raw uploaded file contents
+        name: Original file name, used for the format
+        
+    Returns:
+        Loaded DataFrame
+    """
+    file_extension = Path(name).suffix.lower()
+    buffer = io.BytesIO(file_bytes)
+    
+    if file_extension == '.csv':
+        df = _read_csv_fast(buffer)
+    elif file_extension in ['.xlsx', '.xls']:
+        df = _read_excel_fast(buffer)
+    else:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+    
+    from src.utils import downcast_dtypes
+    
+    # Narrow ints and categorize repetitive strings before any analysis
+    return downcast_dtypes(df)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_memory_mb(file_digest: str, _df: pd.DataFrame) -> float:
+    """
+    Deep memory usage in MB, measured once per distinct upload
+    """
+    return _df.memory_usage(deep=True).sum() / 1024 / 1024
+
+
+@st.cache_resource
+def _executor() -> ThreadPoolExecutor:
+    """
+    Shared worker pool for pipeline stages that can overlap
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+
+@st.cache_resource
+def _pdf_pool() -> ProcessPoolExecutor:
+    """
+    Worker processes for PDF rendering
+    
+    ReportLab layout is pure Python and holds the GIL, so it runs in a
+    separate process to keep the server responsive. Workers are spawned
+    rather than forked: forking the multithreaded server can copy a lock
+    held by another thread into the child and deadlock it.
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, 4),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+
+@st.cache_resource
+def _warm_kernels():
+    """
+    Compile the numba kernels in the background once per server process
+    """
+    def warm():
+        from src._numba_kernels import warm_up
+        warm_up()
+    
+    return _executor().submit(warm)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _eda_engine(file_digest: str, _df: pd.DataFrame):
+    """
+    EDA engine shared by the statistics and the charts of one distinct upload
+    
+    The engine memoises its charts, so they are drawn once per upload and
+    can be requested from the background executor, which must not call
+    st.cache_data functions itself. Charts go to a folder named by the
+    upload digest: the memoised paths must keep pointing at this dataset's
+    images after another upload renders its own.
+    """
+    from src.eda_engine import EDAEngine
+    
+    return EDAEngine(_df, f"reports/assets/{file_digest}")
+
+
+@st.cache_data(show_spinner=False)
+def _cached_eda(file_digest: str, _df: pd.DataFrame) -> dict:
+    """
+    Run EDA statistics once per distinct upload on the shared engine
+    
+    The DataFrame is excluded from the cache key (leading underscore); the
+    digest of the uploaded bytes identifies it without hashing every row.
+    """
+    # Nothing on the page reads the quartiles, so skip their per-column sort
+    return _eda_engine(file_digest, _df).run_full_eda(generate_plots=False, percentiles=False)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_kpis(file_digest: str, dataset_type: str, _df: pd.DataFrame, _eda_summary: dict) -> dict:
+    """
+    Extract KPIs once per distinct upload and dataset type
+    """
+    from src.kpi_extractor import extract_kpis
+    
+    return extract_kpis(_df, dataset_type, _eda_summary)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_narrative(file_digest: str, _eda_summary: dict, _kpis: dict) -> dict:
+    """
+    Generate the narrative for runs without a sidebar API key, once per upload
+    
+    This is the rule-based narrative unless OPENAI_API_KEY is set in the
+    environment. Runs with a key entered in the sidebar are streamed by
+    _stream_narrative and kept in _gpt_narratives.
+    """
+    from src.ai_narrator import generate_narrative
+    
+    return generate_narrative(_eda_summary, _kpis)
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _gpt_narratives() -> dict:
+    """
+    Streamed GPT-4 narratives by (upload digest, API key digest)
+    
+    Shared across reruns and sessions so an identical request is not sent
+    to GPT-4 twice. st.cache_data can't hold these: its function would have
+    to render the stream. Only the key's digest is stored, never the key.
+    """
+    return {}
+
+
+def _stream_narrative(eda_summary: dict, kpis: dict, api_key: str) -> dict:
+    """
+    Generate the GPT-4 narrative, showing its text as it is produced
+    
+    The request runs on the background executor and forwards each text
+    chunk through a queue, which st.write_stream drains on the script
+    thread. The preview is cleared once complete; the full narrative is
+    rendered with the results. If the request fails, generate_narrative
+    falls back to the rule-based text, and a warning says so rather than
+    silently replacing any partial GPT-4 output.
+    
+    Args:
+        eda_summary: EDA results dictionary
+        kpis: KPI dictionary
+        api_key: OpenAI API key
+        
+    Returns:
+        Narrative dictionary
+    """
+    from src.ai_narrator import generate_narrative
+    
+    deltas = queue.SimpleQueue()
+    future = _executor().submit(generate_narrative, eda_summary, kpis, api_key, on_delta=deltas.put)
+    future.add_done_callback(lambda _: deltas.put(None))
+    
+    def _drain():
+        while True:
+            delta = deltas.get()
+            if delta is None:
+                return
+            yield delta
+    
+    placeholder = st.empty()
+    streamed = placeholder.write_stream(_drain())
+    placeholder.empty()
+    
+    narrative = future.result()
+    if narrative['method'] == 'fallback':
+        when = "partway through" if streamed else "before returning any text"
+        st.warning(f"⚠️ The GPT-4 request failed {when}; showing the rule-based narrative instead.")
+    return narrative
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_file_bytes(path: str, mtime: float) -> bytes:
+    """
+    Read a generated file (report, chart, logo) once per version
+    
+    The modification time is part of the cache key, so a regenerated
+    file is picked up while plain reruns skip the disk read.
+    """
+    return Path(path).read_bytes()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _chart_bytes(path: str, mtime: float) -> bytes:
+    """
+    Re-encode a chart PNG as WebP for display
+    
+    Heatmaps and histograms shrink several-fold as WebP, so less data is
+    held by the server and sent to the browser. Falls back to the PNG bytes
+    when Pillow lacks WebP support.
+    """
+    from PIL import Image, features
+    
+    if not features.check('webp'):
+        return _read_file_bytes(path, mtime)
+    
+    buf = io.BytesIO()
+    with Image.open(path) as img:
+        img.save(buf, format='WEBP', quality=CHART_WEBP_QUALITY, method=2)
+    return buf.getvalue()
+
+
+def _chart_mtimes(viz: dict) -> dict:
+    """
+    Stat the generated charts once, when the pipeline finishes
+    
+    Args:
+        viz: Visualizations dictionary from the EDA summary
+        
+    Returns:
+        Modification time of each chart path that exists on disk
+    """
+    paths = [viz.get('correlation_heatmap')] + list(viz.get('distributions', {}).values())
+    mtimes = {}
+    for path in paths:
+        if isinstance(path, str):
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                pass
+    return mtimes
+
+
+@_fragment
+def _render_results():
+    """
+    Render the KPI grid, charts, narrative and downloads from session state
+    
+    Runs as a fragment, so interacting with the download buttons reruns
+    only this panel rather than the whole page.
+    """
+    st.markdown("---")
+    st.markdown("## 📈 Analysis Results")
+    
+    # KPIs
+    st.markdown("### 🎯 Key Performance Indicators")
+    kpis = st.session_state.get('kpis', {})
+    
+    # Display KPIs in a grid - one markdown element for all cards
+    kpi_cards = "".join(
+        f'<div class="kpi-box"><div class="kpi-label">{escape(str(key))}</div>'
+        f'<div class="kpi-value">{escape(str(value))}</div></div>'
+        for key, value in kpis.items()
+    )
+    st.markdown(f'<div class="kpi-grid">{kpi_cards}</div>', unsafe_allow_html=True)
+    
+    # Visualizations
+    st.markdown("### 📊 Visualizations")
+    
+    viz = st.session_state['eda_summary'].get('visualizations', {})
+    # Recorded when the charts were generated, so reruns don't stat the files
+    chart_mtimes = st.session_state.get('chart_mtimes', {})
+    
+    # Correlation heatmap
+    heatmap_path = viz.get('correlation_heatmap')
+    if heatmap_path in chart_mtimes:
+        st.markdown("#### Correlation Matrix")
+        st.image(_chart_bytes(heatmap_path, chart_mtimes[heatmap_path]), use_column_width=True)
+    
+    # Distributions
+    combined_path = viz.get('distributions', {}).get('combined')
+    if combined_path in chart_mtimes:
+        st.markdown("#### Feature Distributions")
+        st.image(_chart_bytes(combined_path, chart_mtimes[combined_path]), use_column_width=True)
+    
+    # AI Narrative
+    st.markdown("### 🤖 AI-Generated Insights")
+    narrative = st.session_state.get('narrative', {})
+    
+    st.info(f"**Generation Method:** {narrative.get('method', 'N/A').upper()} | "
+           f"**Model:** {narrative.get('model', 'N/A')}")
+    
+    st.markdown(narrative.get('narrative', 'No narrative generated'))
+    
+    # Download button
+    if 'pdf_path' in st.session_state:
+        st.markdown("---")
+        st.markdown("### 📥 Download Report")
+        
+        pdf_path = st.session_state['pdf_path']
+        pdf_bytes = _read_file_bytes(pdf_path, os.path.getmtime(pdf_path))
+        
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.download_button(
+                label="📄 Download PDF Report",
+                data=pdf_bytes,
+                file_name=Path(st.session_state['pdf_path']).name,
+                mime="application/pdf",
+                type="primary",
+                use_container_width=True
+            )
+        
+        with col2:
+            # Load metadata
+            metadata_path = Path("reports/report_metadata.json")
+            if metadata_path.exists():
+                # Already written as indented JSON by the PDF generator
+                metadata_bytes = _read_file_bytes(str(metadata_path), metadata_path.stat().st_mtime)
+                
+                st.download_button(
+                    label="📋 Download Metadata",
+                    data=metadata_bytes,
+                    file_name="report_metadata.json",
+                    mime="application/json",
+                    use_container_width=True
+                )
+
+
 def main():
     """
     Main Streamlit application
     """
+    _warm_kernels()
+    
     # Sidebar
     with st.sidebar:
         # Display Eviden logo
         logo_path = Path(__file__).parent / "assets" / "eviden_logo.png"
         if logo_path.exists():
-            st.image(str(logo_path), use_column_width=True)
+            st.image(_read_file_bytes(str(logo_path), logo_path.stat().st_mtime), use_column_width=True)
             st.markdown("<p style='text-align: center;'><b>Created by Algorzen</b></p>", unsafe_allow_html=True)
         else:
             st.markdown("### 📊 Eviden")
@@ -150,7 +584,7 @@ def main():
     uploaded_file = st.file_uploader(
         "Upload CSV or Excel file",
         type=['csv', 'xlsx', 'xls'],
-        help="Upload your dataset for automated analysis (Note: Parquet disabled due to PyArrow compatibility)"
+        help="Supported formats: CSV (.csv) and Excel (.xlsx, .xls)"
     )
     
     if uploaded_file is not None:
@@ -159,13 +593,14 @@ def main():
             with st.spinner("Loading dataset..."):
                 file_extension = Path(uploaded_file.name).suffix.lower()
                 
-                if file_extension == '.csv':
-                    df = pd.read_csv(uploaded_file)
-                elif file_extension in ['.xlsx', '.xls']:
-                    df = pd.read_excel(uploaded_file)
-                else:
+                if file_extension not in ['.csv', '.xlsx', '.xls']:
                     st.error("Unsupported file format. Please upload CSV or Excel files.")
                     return
+                
+                # Reruns (any widget interaction) hit the cache instead of re-parsing
+                file_bytes = uploaded_file.getvalue()
+                file_digest = hashlib.sha1(file_bytes).hexdigest()
+                df = load_uploaded_dataset(file_bytes, uploaded_file.name)
             
             st.success(f"✅ Dataset loaded: {len(df):,} rows × {len(df.columns)} columns")
             
@@ -177,131 +612,65 @@ def main():
                 col1, col2, col3 = st.columns(3)
                 col1.metric("Total Rows", f"{len(df):,}")
                 col2.metric("Total Columns", f"{len(df.columns)}")
-                col3.metric("Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
+                col3.metric("Memory Usage", f"{_cached_memory_mb(file_digest, df):.2f} MB")
             
-            # Run analysis
+            # Run analysis. EDA, charts, KPIs and the narrative are cached per
+            # upload, so a repeated (or interrupted and re-pressed) run only
+            # rebuilds the PDF
             if st.button("🚀 Generate AI Report", type="primary", use_container_width=True):
                 with st.spinner("🔬 Performing exploratory data analysis..."):
-                    # EDA
-                    eda_summary = perform_eda(df)
-                    st.session_state['eda_summary'] = eda_summary
+                    # EDA statistics; the charts render in the background
+                    # while KPIs and the narrative are produced
+                    eda_summary = _cached_eda(file_digest, df)
+                    charts_future = _executor().submit(_eda_engine(file_digest, df).generate_visualizations)
                     
                     dataset_type = eda_summary['dataset_info']['dataset_type']
                     st.info(f"📌 Dataset Type Detected: **{dataset_type.title()}**")
                 
                 with st.spinner("📊 Extracting key performance indicators..."):
                     # KPI Extraction
-                    kpis = extract_kpis(df, dataset_type)
+                    kpis = _cached_kpis(file_digest, dataset_type, df, eda_summary)
                     st.session_state['kpis'] = kpis
                 
                 with st.spinner("🤖 Generating AI narrative..."):
                     # AI Narrative
-                    narrative = generate_narrative(eda_summary, kpis, api_key)
+                    key_digest = hashlib.blake2b(api_key.encode()).hexdigest() if api_key else None
+                    narrative_id = (file_digest, key_digest)
+                    gpt_narratives = _gpt_narratives()
+                    if not api_key:
+                        narrative = _cached_narrative(file_digest, eda_summary, kpis)
+                    elif narrative_id in gpt_narratives:
+                        narrative = gpt_narratives[narrative_id]
+                    else:
+                        # Stream GPT-4 output instead of blocking on the full completion
+                        narrative = _stream_narrative(eda_summary, kpis, api_key)
+                        # A failed request falls back to the rule-based text; retry it next run
+                        if narrative['method'] != 'fallback':
+                            gpt_narratives[narrative_id] = narrative
                     st.session_state['narrative'] = narrative
                 
                 with st.spinner("📄 Creating PDF report..."):
+                    eda_summary['visualizations'] = charts_future.result()
+                    st.session_state['eda_summary'] = eda_summary
+                    st.session_state['chart_mtimes'] = _chart_mtimes(eda_summary['visualizations'])
+                    
                     # PDF Generation
-                    pdf_path = generate_pdf_report(
+                    from src.pdf_generator import generate_pdf_report
+                    
+                    pdf_path = _pdf_pool().submit(
+                        generate_pdf_report,
                         eda_summary,
                         kpis,
                         narrative,
                         author=author_name
-                    )
+                    ).result()
                     st.session_state['pdf_path'] = pdf_path
                 
                 st.success("✅ Analysis complete!")
             
             # Display results if available
             if 'eda_summary' in st.session_state:
-                st.markdown("---")
-                st.markdown("## 📈 Analysis Results")
-                
-                # KPIs
-                st.markdown("### 🎯 Key Performance Indicators")
-                kpis = st.session_state.get('kpis', {})
-                
-                # Display KPIs in a grid
-                kpi_items = list(kpis.items())
-                num_cols = 3
-                for i in range(0, len(kpi_items), num_cols):
-                    cols = st.columns(num_cols)
-                    for j, col in enumerate(cols):
-                        if i + j < len(kpi_items):
-                            key, value = kpi_items[i + j]
-                            col.markdown(f"""
-                            <div class="kpi-box">
-                                <div class="kpi-label">{key}</div>
-                                <div class="kpi-value">{value}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                
-                # Visualizations
-                st.markdown("### 📊 Visualizations")
-                
-                viz = st.session_state['eda_summary'].get('visualizations', {})
-                
-                # Correlation heatmap
-                if viz.get('correlation_heatmap') and Path(viz['correlation_heatmap']).exists():
-                    st.markdown("#### Correlation Matrix")
-                    st.image(viz['correlation_heatmap'], use_column_width=True)
-                
-                # Distributions
-                distributions = viz.get('distributions', {})
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if distributions.get('numeric') and Path(distributions['numeric']).exists():
-                        st.markdown("#### Numeric Distributions")
-                        st.image(distributions['numeric'], use_column_width=True)
-                
-                with col2:
-                    if distributions.get('categorical') and Path(distributions['categorical']).exists():
-                        st.markdown("#### Categorical Distributions")
-                        st.image(distributions['categorical'], use_column_width=True)
-                
-                # AI Narrative
-                st.markdown("### 🤖 AI-Generated Insights")
-                narrative = st.session_state.get('narrative', {})
-                
-                st.info(f"**Generation Method:** {narrative.get('method', 'N/A').upper()} | "
-                       f"**Model:** {narrative.get('model', 'N/A')}")
-                
-                st.markdown(narrative.get('narrative', 'No narrative generated'))
-                
-                # Download button
-                if 'pdf_path' in st.session_state:
-                    st.markdown("---")
-                    st.markdown("### 📥 Download Report")
-                    
-                    with open(st.session_state['pdf_path'], 'rb') as f:
-                        pdf_bytes = f.read()
-                    
-                    col1, col2 = st.columns([2, 1])
-                    with col1:
-                        st.download_button(
-                            label="📄 Download PDF Report",
-                            data=pdf_bytes,
-                            file_name=Path(st.session_state['pdf_path']).name,
-                            mime="application/pdf",
-                            type="primary",
-                            use_container_width=True
-                        )
-                    
-                    with col2:
-                        # Load metadata
-                        metadata_path = Path("reports/report_metadata.json")
-                        if metadata_path.exists():
-                            with open(metadata_path, 'r') as f:
-                                metadata = json.load(f)
-                            
-                            st.download_button(
-                                label="📋 Download Metadata",
-                                data=json.dumps(metadata, indent=2),
-                                file_name="report_metadata.json",
-                                mime="application/json",
-                                use_container_width=True
-                            )
+                _render_results()
         
         except Exception as e:
             st.error(f"❌ Error processing dataset: {str(e)}")